@@ -1,63 +1,93 @@
 import numpy as np
-from vectorField import compute_velocity,Calculate_gamma
-from camberline import camber_line
+from calculateCL import compute_fourier_coefficients, compute_fourier_coefficients_poly
+from airfoilSolution import DEFAULT_CONFIG, get_solution, get_solution_poly
 
-def compute_circulation(M, P, alpha):
+def compute_circulation(M, P, alpha, config=DEFAULT_CONFIG):
     """
     Compute the circulation around the entire airfoil using velocity line-integral approach at given 
     M -> max camber (0,1)
     P -> positon of it (0,1)
     alpha -> angle in radians 
+    config -> SolverConfig (vortex panels, fourier order, free-stream velocity)
      
     -> Here we are taking a circle of radius 2m at the orgin   
     """
-    # Define angles and precompute trigonometric values
-    theta = np.linspace(0, 2 * np.pi, 101)
-    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
-    
-    # Parametric coordinates and tangential unit vectors
-    circle_coords = np.stack((2 * cos_theta, 2 * sin_theta))  # Shape: (2, 101)
-    tangents = np.stack((-2 * sin_theta, 2 * cos_theta))      # Shape: (2, 101)
-    
-    # Compute velocity vectors
-    velocity = compute_velocity(M, P, circle_coords[0], circle_coords[1], alpha)  # Shape: (2, 101)
-    
-    # Compute circulation using vectorized dot product
-    circulation = np.sum(tangents[0] * velocity[0] + tangents[1] * velocity[1])  # Element-wise dot product
-    
-    # Apply integration factor
-    circulation *= -2 * np.pi / 100  # Precomputed factor for efficiency
+    # The vortex sheet is cached per geometry, only the 100 circle samples are evaluated
+    return get_solution(M, P, config=config).circulation(alpha)
 
-    return circulation
 
 
-
-def compute_bound_circulation(M, P, alpha):
+def compute_bound_circulation(M, P, alpha, config=DEFAULT_CONFIG):
     """
     Compute the bound circulation by integrating circulation distribution along camber line
     M -> max camber (0,1)
     P -> positon of it (0,1)
     alpha -> angle in radians
+    config -> SolverConfig (fourier order, free-stream velocity)
     
     """
-    # Define constants
-    num_points = 1000
-    points = np.linspace(0.0001, 0.9999, num_points)
-    
-    # Compute camber line values for all points
-    y = camber_line(points, M, P)  # Vectorized camber line computation
-    y_next = np.roll(y, -1)  # Shift y values to calculate differences
-    y_diff = y_next - y  # Vectorized y differences
-    
-    # Compute gamma values for all points
-    gamma = Calculate_gamma(M, P, points, alpha)  # Vectorized gamma computation
-    
-    # Calculate ds (integration elements) using vectorized operations
-    dx = points[1] - points[0]  # Constant step size in x-direction
-    ds = np.sqrt(dx**2 + y_diff[:-1]**2)  # Exclude last point to match dimensions
-    
-    # Compute circulation using vectorized sum
-    circulation = np.sum(gamma[:-1] * ds)  # Sum gamma * ds
-    return circulation
+    # Gamma along the 1000 chord samples is cached per geometry and split by alpha
+    return get_solution(M, P, config=config).bound_circulation(alpha)
+
+
+def compute_analytic_circulation(M, P, alpha, config=DEFAULT_CONFIG, method="trapezoid"):
+    """
+    Compute the circulation in closed form from thin airfoil theory, Γ = πcU(A0 + A1/2)
+    with chord c = 1. Only A0 and A1 are needed, no vortex panels or velocity field.
+    M -> max camber (0,1)
+    P -> positon of it (0,1)
+    alpha -> angle in radians, or an array of angles
+    config -> SolverConfig (only the free-stream velocity is used)
+    method -> "trapezoid" or "analytic" fourier coefficients
+    """
+    A0, A1 = compute_fourier_coefficients(M, P, 0, 1, method)  # A0 at alpha = 0, alpha is added below
+    return np.pi * config.u_inf * (np.asarray(alpha) + A0 + A1 / 2)
+
+
+def compute_analytic_circulation_poly(coeffs, alpha, config=DEFAULT_CONFIG):
+    """
+    compute_analytic_circulation for a polynomial camber line [a_n, ..., a_1, a_0]
+    """
+    A0, A1 = compute_fourier_coefficients_poly(coeffs, 0, 1)
+    return np.pi * config.u_inf * (np.asarray(alpha) + A0 + A1 / 2)
+
+
+def verify_circulation(M, P, alpha, config=DEFAULT_CONFIG, method="trapezoid"):
+    """
+    Checks the closed-form circulation against the numerical methods (velocity line
+    integral and bound circulation). This runs the expensive paths, use it to validate
+    a configuration and compute_analytic_circulation for production queries.
+
+    alpha -> angle in radians, or an array of angles
+
+    Returns:
+    report : dict -> "analytic", "circulation", "bound_circulation" and for both numerical
+                     methods the discrepancy "<method>_error" (numerical - analytic) and
+                     "<method>_relative_error" (nan when the analytic circulation is 0),
+                     floats for a scalar alpha and arrays of its shape otherwise
+    """
+    analytic = compute_analytic_circulation(M, P, alpha, config, method)
+    return _discrepancies(analytic, get_solution(M, P, method, config), alpha)
+
+
+def verify_circulation_poly(coeffs, alpha, config=DEFAULT_CONFIG):
+    """
+    verify_circulation for a polynomial camber line [a_n, ..., a_1, a_0]
+    """
+    analytic = compute_analytic_circulation_poly(coeffs, alpha, config)
+    return _discrepancies(analytic, get_solution_poly(coeffs, config), alpha)
 
 
+def _discrepancies(analytic, solution, alpha):
+    # The numerical methods take one angle at a time, the report has the shape of alpha
+    alpha = np.asarray(alpha, dtype=float)
+    report = {"analytic": analytic}
+    for name in ("circulation", "bound_circulation"):
+        method = getattr(solution, name)
+        value = np.reshape([method(angle) for angle in alpha.ravel()], alpha.shape)
+        error = value - analytic
+        report[name] = value[()]
+        report[f"{name}_error"] = error[()]
+        report[f"{name}_relative_error"] = np.divide(error, analytic, out=np.full(alpha.shape, np.nan),
+                                                     where=analytic != 0)[()]
+    return report
@@ -0,0 +1,198 @@
+import argparse
+import csv
+import json
+from pathlib import Path
+
+import numpy as np
+
+LOAD_OUTPUTS = ("Cl", "Cm_le", "Cm_c4", "x_cp")
+SCALAR_OUTPUTS = LOAD_OUTPUTS + ("analytic_circulation", "circulation", "bound_circulation")
+FIELD_OUTPUTS = ("velocity",)
+FORMATS = ("csv", "npz", "parquet")
+DEFAULT_FIELD = {"x": [-1.5, 2.5, 30], "y": [-1, 2, 20]}  # The app's vector field grid
+
+
+def load_job(path):
+    """
+    Reads a JSON job file such as
+
+    {
+        "airfoils": ["2412", {"M": 0.02, "P": 0.4}, {"coeffs": [0.1, -0.05, 0.29], "name": "mine"}],
+        "alpha": {"start": -10, "stop": 15, "num": 26},
+        "outputs": ["Cl", "Cm_c4", "x_cp", "analytic_circulation", "circulation", "bound_circulation", "velocity"],
+        "field": {"x": [-1.5, 2.5, 30], "y": [-1, 2, 20]}
+    }
+
+    Airfoils are NACA 4-digit codes, (M, P) pairs or polynomial camber coefficients
+    [a_n, ..., a_1, a_0]. alpha is in degrees, either a list, a single angle or
+    linspace arguments. field gives linspace arguments of the velocity grid.
+
+    Returns:
+    airfoils : list -> (name, M, P, coeffs) per airfoil, coeffs is None for NACA airfoils
+    alpha : numpy array -> Angles of attack (in degrees)
+    outputs : tuple -> Requested outputs
+    field : dict -> Velocity grid
+    """
+    job = json.loads(Path(path).read_text())
+    airfoils = [_parse_airfoil(spec) for spec in job["airfoils"]]
+
+    alpha = job.get("alpha", 0)
+    if isinstance(alpha, dict):
+        alpha = np.linspace(alpha["start"], alpha["stop"], alpha.get("num", 50))
+    alpha = np.atleast_1d(np.asarray(alpha, dtype=float))
+
+    outputs = tuple(job.get("outputs", ("Cl",)))
+    unknown = set(outputs) - set(SCALAR_OUTPUTS + FIELD_OUTPUTS)
+    if unknown:
+        raise ValueError(f"Unknown outputs: {sorted(unknown)}, choose from {SCALAR_OUTPUTS + FIELD_OUTPUTS}")
+    return airfoils, alpha, outputs, dict(DEFAULT_FIELD, **job.get("field", {}))
+
+
+def _parse_airfoil(spec):
+    if isinstance(spec, str):
+        code = spec.upper().removeprefix("NACA").strip()
+        if len(code) != 4 or not code.isdigit():
+            raise ValueError(f"Not a NACA 4-digit code: {spec}")
+        return f"NACA {code}", int(code[0]) / 100, int(code[1]) / 10, None
+    if "coeffs" in spec:
+        coeffs = tuple(float(c) for c in spec["coeffs"])
+        return spec.get("name", "poly " + " ".join(map(str, coeffs))), None, None, coeffs
+    M, P = float(spec["M"]), float(spec["P"])
+    return spec.get("name", f"M={M:g} P={P:g}"), M, P, None
+
+
+def run_job(airfoils, alpha, outputs, field=DEFAULT_FIELD, store=None):
+    """
+    Evaluates every airfoil at every alpha. With a polar store (see resultStore), the
+    LOAD_OUTPUTS of NACA airfoils are read from it and only missing angles are computed
+    and appended.
+
+    Returns:
+    polar : dict -> Columns "airfoil", "alpha" and one per scalar output, one row per (airfoil, alpha)
+    velocity : dict -> Columns "airfoil", "alpha", "x", "y", "vel_x", "vel_y" with one row per
+                       grid point, or None when velocity was not requested
+    """
+    scalars = [name for name in outputs if name in SCALAR_OUTPUTS]
+    polar = {"airfoil": [], "alpha": [], **{name: [] for name in scalars}}
+    velocity = None
+    if "velocity" in outputs:
+        x, y = np.meshgrid(np.linspace(*field["x"]), np.linspace(*field["y"]))
+        velocity = {"airfoil": [], "alpha": [], "x": [], "y": [], "vel_x": [], "vel_y": []}
+
+    for name, M, P, coeffs in airfoils:
+        polar["airfoil"] += [name] * len(alpha)
+        polar["alpha"].append(alpha)
+        stored = None
+        if store is not None and coeffs is None and set(scalars) & set(LOAD_OUTPUTS):
+            from resultStore import fill_polar
+            stored = fill_polar(store, M, P, alpha)
+        for output in scalars:
+            if stored is not None and output in LOAD_OUTPUTS:
+                polar[output].append(stored[output])
+            else:
+                polar[output].append(_scalar_output(output, M, P, coeffs, np.radians(alpha)))
+
+        if velocity is not None:
+            for angle in alpha:
+                vel_x, vel_y = _velocity(M, P, coeffs, x, y, np.radians(angle))
+                velocity["airfoil"] += [name] * x.size
+                for key, value in (("alpha", np.full(x.size, angle)), ("x", x), ("y", y),
+                                   ("vel_x", vel_x), ("vel_y", vel_y)):
+                    velocity[key].append(np.ravel(value))
+
+    polar = {key: np.array(value) if key == "airfoil" else np.concatenate(value or [[]])
+             for key, value in polar.items()}
+    if velocity is not None:
+        velocity = {key: np.array(value) if key == "airfoil" else np.concatenate(value or [[]])
+                    for key, value in velocity.items()}
+    return polar, velocity
+
+
+def _scalar_output(output, M, P, coeffs, alpha):
+    """
+    One scalar output at every alpha (radians) for one airfoil
+    """
+    if output in LOAD_OUTPUTS:
+        from calculateCL import compute_loads, compute_loads_poly
+        if coeffs is None:
+            return compute_loads(M, P, alpha)[output]
+        return compute_loads_poly(coeffs, alpha)[output]
+
+    # The solver modules are imported on demand, so load-only jobs never load them
+    if output == "analytic_circulation":
+        from Circulation import compute_analytic_circulation, compute_analytic_circulation_poly
+        if coeffs is None:
+            return compute_analytic_circulation(M, P, alpha)
+        return compute_analytic_circulation_poly(coeffs, alpha)
+
+    if coeffs is None:
+        from Circulation import compute_bound_circulation, compute_circulation
+        compute = compute_circulation if output == "circulation" else compute_bound_circulation
+        return np.array([compute(M, P, a) for a in alpha])
+
+    from airfoilSolution import get_solution_poly
+    solution = get_solution_poly(coeffs)
+    return np.array([getattr(solution, output)(a) for a in alpha])
+
+
+def _velocity(M, P, coeffs, x, y, alpha):
+    if coeffs is None:
+        from vectorField import compute_velocity
+        return compute_velocity(M, P, x, y, alpha)
+    from vectorFieldUDF import compute_velocity_poly
+    return compute_velocity_poly(coeffs, x, y, alpha)
+
+
+def write_table(columns, path, fmt):
+    """
+    Writes a dict of equal-length columns to path as "csv", "npz" or "parquet".
+    Parquet needs pandas with pyarrow (or fastparquet), which is only imported here.
+    """
+    if fmt == "csv":
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            writer.writerows(zip(*(column.tolist() for column in columns.values())))
+    elif fmt == "npz":
+        np.savez(path, **columns)
+    elif fmt == "parquet":
+        try:
+            import pandas as pd
+        except ImportError as error:
+            raise ImportError("Parquet output needs pandas and pyarrow: pip install pandas pyarrow") from error
+        pd.DataFrame(columns).to_parquet(path, index=False)
+    else:
+        raise ValueError(f"Unknown format: {fmt}, choose from {FORMATS}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Thin airfoil polars, circulation and velocity fields "
+                                                 "from a JSON job file, without the Streamlit UI.")
+    parser.add_argument("job", help="JSON job file, see load_job")
+    parser.add_argument("-o", "--output", default="results.csv",
+                        help="Output file, velocity fields go next to it as <name>_field<suffix>")
+    parser.add_argument("--format", choices=FORMATS, help="Output format (default: from the output suffix)")
+    parser.add_argument("--store", help="Polar store directory: NACA loads are served from it, "
+                                        "missing ones computed and added (created if needed)")
+    args = parser.parse_args(argv)
+
+    output = Path(args.output)
+    fmt = args.format or output.suffix.lstrip(".").lower()
+    if fmt not in FORMATS:
+        parser.error(f"Cannot infer the format from {output}, use --format")
+
+    store = None
+    if args.store:
+        from resultStore import open_polar_store
+        store = open_polar_store(args.store)
+    polar, velocity = run_job(*load_job(args.job), store=store)
+    write_table(polar, output, fmt)
+    print(f"Wrote {output}")
+    if velocity is not None:
+        field_output = output.with_name(f"{output.stem}_field{output.suffix}")
+        write_table(velocity, field_output, fmt)
+        print(f"Wrote {field_output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+import hashlib
+import numpy as np
+from collections import namedtuple
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from calculateCL import (compute_fourier_coefficients, compute_fourier_coefficients_poly, loads_from_coefficients,
+                         poly_fourier_order, sum_sine_series)
+from camberline import camber_line
+from biotSavart import TREE_THETA, induced_velocity, iter_induced_velocity
+from instrumentation import timed, watch_cache
+
+CACHE_SIZE = 128  # Geometries kept in the solution cache
+MAX_FOURIER = 500  # Beyond this the 1000-interval quadrature grids alias cos(nθ)
+BOUND_SAMPLES_PER_PANEL = 10  # Chord samples of the bound circulation integral, 1000 by default
+BOUND_EDGE = 0.0001  # The integral stops this far from the edges, where gamma is singular
+
+
+@dataclass(frozen=True)
+class SolverConfig:
+    """
+    Discretisation of the thin airfoil solver. Frozen, so it can key the solution cache.
+
+    n_panels : int -> Number of vortex elements along the camber line
+    spacing : str -> "uniform" panels, or "cosine" panels clustered at the edges
+    n_fourier : int -> Fourier terms A1..A_n_fourier used for the circulation distribution
+    u_inf : float -> Free-stream velocity
+    """
+    n_panels: int = 100
+    spacing: str = "uniform"
+    n_fourier: int = 99
+    u_inf: float = 20  # Free-stream velocity as per our simulations
+
+    def panels(self):
+        """
+        Vortex element positions (panel midpoints) and panel widths along the chord
+        """
+        if self.spacing == "uniform":
+            edges = np.linspace(0, 1, self.n_panels + 1)
+            points = (edges[:-1] + edges[1:]) / 2
+        elif self.spacing == "cosine":
+            theta = np.linspace(0, np.pi, self.n_panels + 1)
+            edges = (1 - np.cos(theta)) / 2
+            points = (1 - np.cos((theta[:-1] + theta[1:]) / 2)) / 2
+        else:
+            raise ValueError(f"Unknown spacing: {self.spacing}")
+        return points, np.diff(edges)
+
+    def refined(self):
+        """
+        The same configuration with twice the panels and fourier terms (up to MAX_FOURIER)
+        """
+        n_fourier = max(self.n_fourier, min(2 * self.n_fourier, MAX_FOURIER))
+        return SolverConfig(2 * self.n_panels, self.spacing, n_fourier, self.u_inf)
+
+
+# 100 uniform panels of width 0.01 between 0.005 and 0.995, A1..A99 and u = 20
+DEFAULT_CONFIG = SolverConfig()
+
+
+class AirfoilSolution:
+    """
+    Thin airfoil solution for one camber line, built once per geometry.
+
+    Holds the camber samples at the vortex elements, the fourier coefficients and
+    the vortex strengths. Alpha only enters through A0 = alpha + A0(alpha = 0), so
+    every quantity is stored as an alpha-independent camber part plus a part
+    proportional to alpha, and changing alpha never recomputes the coefficients.
+    """
+
+    def __init__(self, camber, coefficients, config=DEFAULT_CONFIG):
+        """
+        camber : callable -> Camber line height z(x) for an array of x
+        coefficients : numpy array -> [A0, A1, ..., A_N] at alpha = 0
+        config : SolverConfig -> Panels, fourier order and free-stream velocity
+        """
+        self.camber = camber
+        self.coefficients = _read_only(coefficients)
+        self.config = config
+        vortex_points, panel_widths = config.panels()
+        self.vortex_points = _read_only(vortex_points)
+        self.panel_widths = _read_only(panel_widths)
+        self.vortex_heights = _read_only(camber(vortex_points))
+
+        # gamma(alpha) = alpha * gamma_alpha + gamma_camber at the vortex elements
+        self._gamma_alpha, self._gamma_camber = self._gamma_parts(vortex_points)
+
+    @classmethod
+    def from_naca(cls, M, P, method="trapezoid", config=DEFAULT_CONFIG):
+        """
+        Solution for a NACA 4-digit camber line (M, P)
+        """
+        coefficients = compute_fourier_coefficients(M, P, 0, config.n_fourier, method)
+        return cls(lambda x: camber_line(x, M, P), coefficients, config)
+
+    @classmethod
+    def from_poly(cls, coeffs, config=DEFAULT_CONFIG, method="chebyshev"):
+        """
+        Solution for a polynomial camber line [a_n, ..., a_1, a_0] (highest order first).
+        method "chebyshev" gives exact coefficients, "trapezoid" the original quadrature
+        (all config.n_fourier terms, as in the original solver).
+        """
+        coeffs = np.array(coeffs, dtype=float)
+        n_fourier = config.n_fourier
+        if method == "chebyshev":
+            # A_n vanishes beyond the degree of the slope, so only those terms are kept (at least A1)
+            n_fourier = min(n_fourier, max(poly_fourier_order(coeffs), 1))
+        coefficients = compute_fourier_coefficients_poly(coeffs, 0, n_fourier, method)
+        return cls(lambda x: np.polyval(coeffs, x), coefficients, config)
+
+    @timed("gamma")
+    def _gamma_parts(self, x):
+        """
+        Split gamma at x into its per-radian alpha part and its camber part
+        """
+        u = self.config.u_inf
+        theta = np.arccos(1 - 2 * x)
+        per_A0 = 2 * u * (1 + np.cos(theta)) / np.sin(theta)
+        camber = per_A0 * self.coefficients[0] + 2 * u * sum_sine_series(self.coefficients, theta)
+        return _read_only(per_A0), _read_only(camber)
+
+    def A0(self, alpha):
+        """
+        A0 at angle of attack alpha (radians)
+        """
+        return alpha + self.coefficients[0]
+
+    def fourier_coefficients(self, alpha):
+        """
+        [A0, A1, ..., A_N] at angle of attack alpha (radians)
+        """
+        coefficients = self.coefficients.copy()
+        coefficients[0] = self.A0(alpha)
+        return coefficients
+
+    def Cl(self, alpha):
+        """
+        Lift coefficient at angle of attack alpha (radians)
+        """
+        return np.pi * (2 * self.A0(alpha) + self.coefficients[1])
+
+    def loads(self, alpha, x=None):
+        """
+        Cl, Cm_le, Cm_c4, centre of pressure and optionally ΔCp(x) from the stored
+        coefficients, for a single alpha or an array of them (radians)
+        """
+        return loads_from_coefficients(self.coefficients, alpha, x)
+
+    def analytic_circulation(self, alpha):
+        """
+        Circulation from thin airfoil theory, Γ = πcU(A0 + A1/2) with chord c = 1
+        """
+        return np.pi * self.config.u_inf * (self.A0(alpha) + self.coefficients[1] / 2)
+
+    def gamma(self, x, alpha):
+        """
+        Circulation distribution at chordwise positions x
+        """
+        per_A0, camber = self._gamma_parts(x)
+        return alpha * per_A0 + camber
+
+    def vortex_strengths(self, alpha):
+        """
+        Circulation of each vortex element (gamma * panel width)
+        """
+        return (alpha * self._gamma_alpha + self._gamma_camber) * self.panel_widths
+
+    def vortex_Cl(self, alpha):
+        """
+        Lift coefficient of the discrete vortex sheet, 2 * (total circulation) / (u * chord)
+        """
+        return 2 * np.sum(self.vortex_strengths(alpha)) / self.config.u_inf
+
+    def velocity(self, x, y, alpha, chunk_size=None, dtype=np.float64, kernel="direct", theta=TREE_THETA):
+        """
+        Net velocity (induced + free stream) at points (x, y), flattened to (n_points,).
+        chunk_size and dtype bound the memory of the induced velocity sum, kernel and
+        theta select direct summation or the tree code, see biotSavart.
+        """
+        for _, _, vel_x, vel_y in self.iter_velocity(x, y, alpha, chunk_size, dtype, kernel, theta):
+            pass
+        return vel_x, vel_y
+
+    def iter_velocity(self, x, y, alpha, chunk_size=None, dtype=np.float64, kernel="direct", theta=TREE_THETA):
+        """
+        Streams velocity tile by tile, yielding (start, stop, vel_x, vel_y) where the
+        full output arrays are filled up to stop
+        """
+        tiles = iter_induced_velocity(x, y, self.vortex_points, self.vortex_heights,
+                                      self.vortex_strengths(alpha), chunk_size, dtype, kernel, theta)
+        for start, stop, vel_x, vel_y in tiles:
+            # Add free-stream velocity components
+            vel_x[start:stop] += self.config.u_inf * np.cos(alpha)
+            vel_y[start:stop] += self.config.u_inf * np.sin(alpha)
+            yield start, stop, vel_x, vel_y
+
+    def velocity_basis(self, x, y, chunk_size=None, dtype=np.float64, kernel="direct", theta=TREE_THETA):
+        """
+        The induced velocity split like gamma, into a per-radian alpha part and a camber
+        part, so velocity(x, y, alpha) = alpha * per_alpha + camber + free stream.
+
+        Returns:
+        per_alpha, camber : tuple -> (vel_x, vel_y) of each part, flattened to (n_points,)
+        """
+        return tuple(induced_velocity(x, y, self.vortex_points, self.vortex_heights, part * self.panel_widths,
+                                      chunk_size, dtype, kernel, theta)
+                     for part in (self._gamma_alpha, self._gamma_camber))
+
+    @cached_property
+    def fingerprint(self):
+        """
+        Digest of the vortex sheet (positions, heights, widths and gamma parts), a stable
+        key for results derived from it, such as stored velocity grids
+        """
+        digest = hashlib.sha1()
+        for array in (self.vortex_points, self.vortex_heights, self.panel_widths, self._gamma_alpha, self._gamma_camber):
+            digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+        digest.update(np.float64(self.config.u_inf).tobytes())
+        return digest.hexdigest()
+
+    @timed("integration")
+    def circulation(self, alpha):
+        """
+        Circulation from the velocity line integral around a circle of radius 2 at the origin
+        """
+        # Trapezoid rule on a closed curve: 100 distinct samples, θ = 2π would repeat θ = 0
+        theta = np.linspace(0, 2 * np.pi, 100, endpoint=False)
+        cos_theta, sin_theta = np.cos(theta), np.sin(theta)
+        vel_x, vel_y = self.velocity(2 * cos_theta, 2 * sin_theta, alpha)
+
+        # Tangent vectors (-2 sinθ, 2 cosθ), dotted with the velocity
+        circulation = np.sum(-2 * sin_theta * vel_x + 2 * cos_theta * vel_y)
+        return circulation * -2 * np.pi / 100
+
+    @cached_property
+    def _bound_samples(self):
+        """
+        Chord samples, segment lengths and gamma parts for the bound circulation, refined
+        with the panels (BOUND_SAMPLES_PER_PANEL samples each) and clustered at the edges
+        like them for cosine spacing
+        """
+        n_samples = BOUND_SAMPLES_PER_PANEL * self.config.n_panels
+        if self.config.spacing == "cosine":
+            theta = np.arccos(1 - 2 * np.array([BOUND_EDGE, 1 - BOUND_EDGE]))
+            points = (1 - np.cos(np.linspace(theta[0], theta[1], n_samples))) / 2
+        else:
+            points = np.linspace(BOUND_EDGE, 1 - BOUND_EDGE, n_samples)
+        y_diff = np.diff(self.camber(points))
+        ds = np.sqrt(np.diff(points)**2 + y_diff**2)
+        per_A0, camber = self._gamma_parts(points[:-1])
+        return ds, per_A0, camber
+
+    @timed("integration")
+    def bound_circulation(self, alpha):
+        """
+        Bound circulation by integrating the circulation distribution along the camber line
+        """
+        ds, per_A0, camber = self._bound_samples
+        return np.sum((alpha * per_A0 + camber) * ds)
+
+
+def _read_only(array):
+    array = np.asarray(array)
+    array.flags.writeable = False
+    return array
+
+
+@watch_cache("naca_solutions")
+@lru_cache(maxsize=CACHE_SIZE)
+def get_solution(M, P, method="trapezoid", config=DEFAULT_CONFIG):
+    """
+    Cached AirfoilSolution for a NACA 4-digit camber line (M, P)
+    """
+    return AirfoilSolution.from_naca(M, P, method, config)
+
+
+@watch_cache("poly_solutions")
+@lru_cache(maxsize=CACHE_SIZE)
+def _poly_solution(coeffs, config, method):
+    return AirfoilSolution.from_poly(coeffs, config, method)
+
+
+def get_solution_poly(coeffs, config=DEFAULT_CONFIG, method="chebyshev"):
+    """
+    Cached AirfoilSolution for a polynomial camber line [a_n, ..., a_1, a_0]
+    """
+    return _poly_solution(tuple(float(c) for c in coeffs), config, method)
+
+
+CONVERGENCE_QUANTITIES = ("circulation", "bound_circulation", "Cl")
+# Starting point of convergence studies: cosine panels resolve the edge singularities, so
+# circulation and Cl settle within 1e-4 at 200 panels, where uniform panels need more than 6400
+CONVERGENCE_CONFIG = SolverConfig(spacing="cosine")
+CONVERGENCE_ATOL = 1e-9  # Changes are relative to max(|value|, atol), so zero quantities converge too
+
+# Result of a convergence study: the last solution, whether quantity settled within tol
+# before max_panels, and the relative change of the last refinement (nan without one)
+Convergence = namedtuple("Convergence", ["solution", "converged", "change"])
+
+
+def converged_solution(M, P, alpha, quantity="circulation", tol=1e-4, config=CONVERGENCE_CONFIG,
+                       max_panels=6400, method="trapezoid", atol=CONVERGENCE_ATOL):
+    """
+    Refines the solver (doubling panels and fourier terms, starting from config) until
+    quantity changes by less than tol relative to max(|value|, atol). Easy cases stop at
+    the first refinement, hard ones keep going up to max_panels.
+
+    quantity : str -> "circulation" (line integral), "bound_circulation" or
+                      "Cl" (lift of the discrete vortex sheet)
+
+    Returns:
+    result : Convergence -> The finest solution built, converged (False when max_panels
+                            was reached first, or allows no refinement of config) and the
+                            last relative change
+    """
+    return _converge(lambda c: get_solution(M, P, method, c), alpha, quantity, tol, config, max_panels, atol)
+
+
+def converged_solution_poly(coeffs, alpha, quantity="circulation", tol=1e-4, config=CONVERGENCE_CONFIG,
+                            max_panels=6400, atol=CONVERGENCE_ATOL):
+    """
+    converged_solution for a polynomial camber line [a_n, ..., a_1, a_0]
+    """
+    return _converge(lambda c: get_solution_poly(coeffs, c), alpha, quantity, tol, config, max_panels, atol)
+
+
+def _converge(build, alpha, quantity, tol, config, max_panels, atol):
+    if quantity not in CONVERGENCE_QUANTITIES:
+        raise ValueError(f"Unknown quantity: {quantity}, choose from {CONVERGENCE_QUANTITIES}")
+    evaluate = "vortex_Cl" if quantity == "Cl" else quantity
+
+    solution = build(config)
+    value = getattr(solution, evaluate)(alpha)
+    converged, change = False, np.nan
+    while not converged and 2 * solution.config.n_panels <= max_panels:
+        solution = build(solution.config.refined())
+        refined_value = getattr(solution, evaluate)(alpha)
+        change = float(abs(refined_value - value) / max(abs(refined_value), atol))
+        converged, value = bool(change <= tol), refined_value
+    return Convergence(solution, converged, change)
@@ -0,0 +1,333 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Compute modules must import without plotting or UI libraries
+COMPUTE_MODULES = ("calculateCL", "camberline", "camberSlope", "biotSavart", "airfoilSolution",
+                   "Circulation", "vectorField", "vectorFieldUDF", "velocityGrid", "streamlines", "resultStore",
+                   "jobQueue", "sweepRunner", "airfoilCli")
+HEAVY_MODULES = ("matplotlib", "streamlit", "pandas", "scipy", "numba")
+IMPORT_BUDGET_MS = 50  # Import time allowed on top of numpy, per module
+IMPORT_REPEATS = 5
+
+# Run in a fresh interpreter: numpy first (every module needs it), then the module
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import numpy
+numpy_done = time.perf_counter()
+import {module}
+done = time.perf_counter()
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps([numpy_done - start, done - numpy_done, heavy]))
+"""
+
+
+def measure_import(module, repeats=IMPORT_REPEATS):
+    """
+    Import time of a module in a fresh interpreter, on top of importing numpy.
+
+    Parameters:
+    module : str -> Module name, importable from this directory
+    repeats : int -> Fresh interpreters to start, the fastest one is reported
+
+    Returns:
+    numpy_ms : float -> Time to import numpy (ms)
+    module_ms : float -> Time to import the module after numpy (ms)
+    heavy : list -> HEAVY_MODULES the import pulled in
+    """
+    probe = _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)
+    runs = []
+    for _ in range(repeats):
+        result = subprocess.run([sys.executable, "-c", probe], cwd=Path(__file__).parent,
+                                capture_output=True, text=True, check=True)
+        runs.append(json.loads(result.stdout))
+    numpy_s = min(run[0] for run in runs)
+    module_s = min(run[1] for run in runs)
+    return 1000 * numpy_s, 1000 * module_s, runs[0][2]
+
+
+def check_imports(modules=COMPUTE_MODULES, budget_ms=IMPORT_BUDGET_MS, repeats=IMPORT_REPEATS):
+    """
+    Measures every module and returns the failures: modules that import a heavy
+    library or take longer than budget_ms on top of numpy
+    """
+    failures = []
+    for module in modules:
+        numpy_ms, module_ms, heavy = measure_import(module, repeats)
+        print(f"{module:16s} {module_ms:7.1f} ms  (numpy {numpy_ms:.1f} ms)  {', '.join(heavy)}")
+        if heavy:
+            failures.append(f"{module} imports {', '.join(heavy)}")
+        if module_ms > budget_ms:
+            failures.append(f"{module} takes {module_ms:.1f} ms to import, budget {budget_ms} ms")
+    return failures
+
+
+# Entry point benchmarks: name -> (problem sizes, setup(size) returning a zero-argument callable,
+# minimum throughput in sizes per second at the largest size or None)
+BENCHMARKS = {}
+REPEATS = 5
+THRESHOLD = 0.25  # Allowed relative slowdown (or memory growth) against a baseline
+TIME_SLACK_S = 5e-4  # Absolute slack so that sub-millisecond noise never fails a run
+MEMORY_SLACK_BYTES = 64 * 1024
+
+NACA = (0.02, 0.4)
+POLY = (0.1, -0.05, 0.02, -0.01, 0.29)
+
+
+def benchmark(name, sizes, min_rate=None):
+    """
+    Registers a benchmark setup under name in BENCHMARKS. With min_rate, the run fails
+    when the largest size processes fewer than min_rate items (of size) per second.
+    """
+    def register(setup):
+        BENCHMARKS[name] = (sizes, setup, min_rate)
+        return setup
+    return register
+
+
+@benchmark("compute_Cl", (1, 100, 1000))
+def _compute_Cl(size):
+    from calculateCL import compute_Cl
+    alphas = np.linspace(-0.2, 0.3, size)
+    return lambda: [compute_Cl(*NACA, alpha) for alpha in alphas]
+
+
+@benchmark("compute_Cl_poly", (1, 100, 1000))
+def _compute_Cl_poly(size):
+    from calculateCL import compute_Cl_poly
+    alphas = np.linspace(-0.2, 0.3, size)
+    return lambda: [compute_Cl_poly(POLY, alpha) for alpha in alphas]
+
+
+@benchmark("compute_naca_batch", (10_000, 1_000_000), min_rate=1e6)
+def _compute_naca_batch(size):
+    from calculateCL import compute_naca_batch
+    M = np.linspace(0, 0.09, 100)[:, None, None]
+    P = np.linspace(0.1, 0.9, 100)[None, :, None]
+    alpha = np.linspace(-0.2, 0.3, size // 10_000)[None, None, :]
+    return lambda: compute_naca_batch(M, P, alpha)
+
+
+@benchmark("Calculate_gamma", (100, 10_000, 100_000))
+def _Calculate_gamma(size):
+    from vectorField import Calculate_gamma
+    x = np.linspace(0.001, 0.999, size)
+    return lambda: Calculate_gamma(*NACA, x, 0.05)
+
+
+@benchmark("Calculate_gamma_poly", (100, 10_000, 100_000))
+def _Calculate_gamma_poly(size):
+    from vectorFieldUDF import Calculate_gamma
+    x = np.linspace(0.001, 0.999, size)
+    return lambda: Calculate_gamma(POLY, x, 0.05)
+
+
+def _field(size):
+    """
+    A square grid of about size points around the airfoil
+    """
+    side = int(np.sqrt(size))
+    return np.meshgrid(np.linspace(-1.5, 2.5, side), np.linspace(-1, 2, side))
+
+
+@benchmark("compute_velocity", (600, 40_000, 250_000))
+def _compute_velocity(size):
+    from vectorField import compute_velocity
+    x, y = _field(size)
+    return lambda: compute_velocity(*NACA, x, y, 0.05)
+
+
+@benchmark("compute_velocity_direct", (10_000, 100_000, 1_000_000))
+def _compute_velocity_direct(size):
+    from vectorField import compute_velocity
+    x, y = _field(size)
+    return lambda: compute_velocity(*NACA, x, y, 0.05, kernel="direct")
+
+
+@benchmark("compute_velocity_tree", (10_000, 100_000, 1_000_000))
+def _compute_velocity_tree(size):
+    from vectorField import compute_velocity
+    x, y = _field(size)
+    return lambda: compute_velocity(*NACA, x, y, 0.05, kernel="tree")
+
+
+@benchmark("compute_velocity_poly", (600, 40_000, 250_000))
+def _compute_velocity_poly(size):
+    from vectorFieldUDF import compute_velocity_poly
+    x, y = _field(size)
+    return lambda: compute_velocity_poly(POLY, x, y, 0.05)
+
+
+@benchmark("compute_circulation", (1, 10, 100))
+def _compute_circulation(size):
+    from Circulation import compute_circulation
+    alphas = np.linspace(-0.2, 0.3, size)
+    return lambda: [compute_circulation(*NACA, alpha) for alpha in alphas]
+
+
+@benchmark("compute_bound_circulation", (1, 10, 100))
+def _compute_bound_circulation(size):
+    from Circulation import compute_bound_circulation
+    alphas = np.linspace(-0.2, 0.3, size)
+    return lambda: [compute_bound_circulation(*NACA, alpha) for alpha in alphas]
+
+
+@benchmark("compute_streamlines", (100, 1000, 5000))
+def _compute_streamlines(size):
+    from streamlines import compute_streamlines, inflow_seeds
+    seeds = inflow_seeds(size)
+    return lambda: compute_streamlines(*NACA, *seeds, 0.05, velocity="bilinear")
+
+
+def _clear_caches():
+    """
+    Forget cached solutions, so every repeat pays for a new geometry
+    """
+    if "airfoilSolution" in sys.modules:
+        sys.modules["airfoilSolution"].get_solution.cache_clear()
+        sys.modules["airfoilSolution"]._poly_solution.cache_clear()
+    if "velocityGrid" in sys.modules:
+        sys.modules["velocityGrid"].GRID_CACHE.cache_clear()
+
+
+def measure(function, repeats=REPEATS):
+    """
+    Times a callable and traces its memory. A warm-up call (imports, numba
+    compilation, quadrature tables) runs first and is not counted, the solution
+    cache is cleared before every counted call.
+
+    Returns:
+    result : dict -> "time_s" (fastest repeat), "median_s", "peak_bytes" (traced peak
+                     above the starting point) and "blocks" / "retained_bytes"
+                     (allocations still alive after the call, e.g. cache entries)
+    """
+    _clear_caches()
+    function()
+
+    times = []
+    for _ in range(repeats):
+        _clear_caches()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    _clear_caches()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start_bytes = tracemalloc.get_traced_memory()[0]
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    retained = tracemalloc.take_snapshot().compare_to(before, "filename")
+    tracemalloc.stop()
+
+    return {
+        "time_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_bytes": peak - start_bytes,
+        "blocks": sum(stat.count_diff for stat in retained),
+        "retained_bytes": sum(stat.size_diff for stat in retained),
+    }
+
+
+def run_benchmarks(names=None, repeats=REPEATS):
+    """
+    Runs the registered benchmarks (all by default) at every problem size.
+
+    Returns:
+    report : dict -> Environment info and a "results" dict keyed by "name[size]"
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        sizes, setup, _ = BENCHMARKS[name]
+        for size in sizes:
+            key = f"{name}[{size}]"
+            results[key] = result = measure(setup(size), repeats)
+            result["rate"] = size / result["time_s"]
+            print(f"{key:34s} {1000 * result['time_s']:10.3f} ms  peak {result['peak_bytes'] / 2**20:8.2f} MB"
+                  f"  retained {result['blocks']:6d} blocks  {result['rate']:10.3g} /s")
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def check_targets(report):
+    """
+    Benchmarks whose largest size ran below the registered min_rate
+    """
+    failures = []
+    for name, (sizes, _, min_rate) in BENCHMARKS.items():
+        result = report["results"].get(f"{name}[{max(sizes)}]")
+        if min_rate is not None and result is not None and result["rate"] < min_rate:
+            failures.append(f"{name}[{max(sizes)}] runs {result['rate']:.3g} /s, target {min_rate:.3g} /s")
+    return failures
+
+
+def compare(report, baseline, threshold=THRESHOLD):
+    """
+    Compares a report with a baseline report and returns the regressions: entries
+    whose time or peak memory grew by more than threshold (relative)
+    """
+    regressions = []
+    for key, result in report["results"].items():
+        if key not in baseline["results"]:
+            continue
+        base = baseline["results"][key]
+        if result["time_s"] > base["time_s"] * (1 + threshold) + TIME_SLACK_S:
+            regressions.append(f"{key} time {1000 * base['time_s']:.3f} -> {1000 * result['time_s']:.3f} ms")
+        if result["peak_bytes"] > base["peak_bytes"] * (1 + threshold) + MEMORY_SLACK_BYTES:
+            regressions.append(f"{key} peak memory {base['peak_bytes']} -> {result['peak_bytes']} bytes")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Performance checks for the compute modules. "
+                                                 "Without a command, both checks run.")
+    commands = parser.add_subparsers(dest="command")
+
+    imports = commands.add_parser("imports", help="Import time and heavy dependencies of every compute module")
+    imports.add_argument("--budget", type=float, default=IMPORT_BUDGET_MS,
+                         help="Import time allowed per module on top of numpy (ms)")
+    imports.add_argument("--repeats", type=int, default=IMPORT_REPEATS)
+
+    run = commands.add_parser("run", help="Time and trace the compute entry points")
+    run.add_argument("--cases", nargs="+", choices=list(BENCHMARKS), help="Benchmarks to run (default: all)")
+    run.add_argument("--repeats", type=int, default=REPEATS)
+    run.add_argument("--save", help="Write the report to this JSON file, e.g. as a new baseline")
+    run.add_argument("--compare", help="Baseline JSON report, regressions fail the run")
+    run.add_argument("--threshold", type=float, default=THRESHOLD,
+                     help="Allowed relative slowdown or memory growth against the baseline")
+    args = parser.parse_args(argv)
+
+    failures = []
+    if args.command in (None, "imports"):
+        failures += check_imports(budget_ms=getattr(args, "budget", IMPORT_BUDGET_MS),
+                                  repeats=getattr(args, "repeats", IMPORT_REPEATS))
+    if args.command in (None, "run"):
+        report = run_benchmarks(getattr(args, "cases", None), getattr(args, "repeats", REPEATS))
+        failures += check_targets(report)
+        if getattr(args, "save", None):
+            Path(args.save).write_text(json.dumps(report, indent=2))
+            print(f"Wrote {args.save}")
+        if getattr(args, "compare", None):
+            baseline = json.loads(Path(args.compare).read_text())
+            failures += compare(report, baseline, args.threshold)
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
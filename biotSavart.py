@@ -0,0 +1,262 @@
+import numpy as np
+from instrumentation import count, stage
+from jobQueue import checkpoint
+
+TILE_ELEMENTS = 2**18  # (field point x vortex) pairs per tile, about 2 MB per float64 buffer
+
+# Direct kernel: numba is optional and only imported (and compiled) for problems of at
+# least JIT_MIN_PAIRS pairs, smaller ones use the blocked numpy path
+JIT = True
+JIT_MIN_PAIRS = 2**16
+
+# Tree code: problems below TREE_MIN_PAIRS (field point x vortex) pairs fall back to direct summation
+TREE_MIN_PAIRS = 2**20
+TREE_LEAF_SIZE = 32  # Vortices per leaf, summed directly when a leaf is too close
+TREE_THETA = 0.5  # Opening ratio: a node is far when its radius < theta * distance
+TREE_ORDER = 12  # Multipole terms, the relative error is about theta**(order + 1)
+TREE_TILE_POINTS = 2**16
+
+
+def induced_velocity(x, y, x_vortex, y_vortex, strength, chunk_size=None, dtype=np.float64,
+                     kernel="direct", theta=TREE_THETA, order=TREE_ORDER):
+    """
+    Computes the velocity induced at points (x, y) by a set of point vortices
+    (Biot-Savart law for 2D point vortices).
+
+    Parameters:
+    x : array-like -> X-coordinates of the points
+    y : array-like -> Y-coordinates of the points
+    x_vortex : numpy array -> X-coordinates of the vortex elements
+    y_vortex : numpy array -> Y-coordinates of the vortex elements
+    strength : numpy array -> Circulation of each vortex element (gamma * panel width)
+    chunk_size : int -> Field points per tile (default: bounded by TILE_ELEMENTS)
+    dtype : numpy dtype -> float64, or float32 to halve memory traffic
+    kernel : str -> "direct" summation, or "tree" (Barnes-Hut tree code with multipole
+                    expansions, falls back to direct below TREE_MIN_PAIRS)
+    theta : float -> Tree opening ratio, smaller is more accurate and slower
+    order : int -> Tree multipole order
+
+    Returns:
+    vel_x, vel_y : numpy array -> Induced velocity components, flattened to (n_points,)
+    """
+    tiles = iter_induced_velocity(x, y, x_vortex, y_vortex, strength, chunk_size, dtype, kernel, theta, order)
+    for _, _, vel_x, vel_y in tiles:
+        pass
+    return vel_x, vel_y
+
+
+def iter_induced_velocity(x, y, x_vortex, y_vortex, strength, chunk_size=None, dtype=np.float64,
+                          kernel="direct", theta=TREE_THETA, order=TREE_ORDER):
+    """
+    Streams induced_velocity tile by tile so callers can draw partial results.
+    Temporaries are preallocated once with shape (chunk_size, n_vortex) and reused,
+    so memory stays bounded for any field size.
+
+    Yields:
+    start, stop, vel_x, vel_y -> Tile range and the full output arrays, filled up to stop
+    """
+    # Ensure x and y are flattened to 1D arrays
+    x = np.asarray(x, dtype=dtype).flatten()  # Shape: (n_points,)
+    y = np.asarray(y, dtype=dtype).flatten()  # Shape: (n_points,)
+    x_vortex = np.asarray(x_vortex, dtype=dtype)
+    y_vortex = np.asarray(y_vortex, dtype=dtype)
+    scaled_strength = (np.asarray(strength, dtype=dtype) / (2 * np.pi)).astype(dtype)
+
+    n_points, n_vortex = len(x), len(x_vortex)
+    if kernel not in ("direct", "tree"):
+        raise ValueError(f"Unknown kernel: {kernel}")
+    if kernel == "tree" and n_points * n_vortex >= TREE_MIN_PAIRS and n_vortex > TREE_LEAF_SIZE:
+        yield from _iter_tree_velocity(x, y, x_vortex, y_vortex, scaled_strength, chunk_size, dtype, theta, order)
+        return
+
+    if chunk_size is None:
+        chunk_size = max(1, TILE_ELEMENTS // max(n_vortex, 1))
+    chunk_size = max(1, min(chunk_size, n_points))
+
+    vel_x = np.empty(n_points, dtype=dtype)
+    vel_y = np.empty(n_points, dtype=dtype)
+    if n_points == 0:
+        yield 0, 0, vel_x, vel_y
+
+    count("vortex_pairs", n_points * n_vortex)
+    fused_kernel = _jit_kernel() if n_points * n_vortex >= JIT_MIN_PAIRS else None
+    if fused_kernel is None:
+        dx, dy, r2, weight = (np.empty((chunk_size, n_vortex), dtype=dtype) for _ in range(4))
+
+    for start in range(0, n_points, chunk_size):
+        checkpoint()  # Cancelled background jobs stop between tiles
+        stop = min(start + chunk_size, n_points)
+        n = stop - start
+        tile = (x[start:stop], y[start:stop], x_vortex, y_vortex, scaled_strength)
+        with stage("induced_velocity"):
+            if fused_kernel is None:
+                _tile_kernel(*tile, dx[:n], dy[:n], r2[:n], weight[:n], vel_x[start:stop], vel_y[start:stop])
+            else:
+                fused_kernel(*tile, vel_x[start:stop], vel_y[start:stop])
+        yield start, stop, vel_x, vel_y
+
+
+def _tile_kernel(x, y, x_vortex, y_vortex, scaled_strength, dx, dy, r2, weight, vel_x, vel_y):
+    """
+    Induced velocity of one tile, written into vel_x and vel_y using only the given buffers.
+    With s = strength / 2π the components are sum(s * dy / r^2) and -sum(s * dx / r^2),
+    so no sqrt or per-component divide is needed and einsum reduces without temporaries.
+    """
+    # Broadcast field points against vortex points
+    np.subtract(x[:, None], x_vortex, out=dx)
+    np.subtract(y[:, None], y_vortex, out=dy)
+    np.multiply(dx, dx, out=r2)
+    np.multiply(dy, dy, out=weight)
+    r2 += weight  # Squared distances
+
+    np.divide(scaled_strength, r2, out=weight)
+    np.einsum("ij,ij->i", dy, weight, out=vel_x)
+    np.einsum("ij,ij->i", dx, weight, out=vel_y)
+    np.negative(vel_y, out=vel_y)
+
+
+_fused_kernel = None
+
+
+def _jit_kernel():
+    """
+    The numba-compiled direct kernel, or None when numba is disabled or not installed.
+    JIT is read on every call, so it can be switched off after the kernel was compiled.
+    """
+    global _fused_kernel, JIT
+    if not JIT:
+        return None
+    if _fused_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            JIT = False
+            return None
+
+        @numba.njit(cache=True, nogil=True)  # Releases the GIL, so background job threads run in parallel
+        def fused_kernel(x, y, x_vortex, y_vortex, scaled_strength, vel_x, vel_y):
+            # One pass per field point, accumulating both components without temporaries
+            for i in range(len(x)):
+                sum_x = 0.0
+                sum_y = 0.0
+                for k in range(len(x_vortex)):
+                    dx = x[i] - x_vortex[k]
+                    dy = y[i] - y_vortex[k]
+                    weight = scaled_strength[k] / (dx * dx + dy * dy)
+                    sum_x += weight * dy
+                    sum_y -= weight * dx
+                vel_x[i] = sum_x
+                vel_y[i] = sum_y
+
+        _fused_kernel = fused_kernel
+    return _fused_kernel
+
+
+def _iter_tree_velocity(x, y, x_vortex, y_vortex, scaled_strength, chunk_size, dtype, theta, order):
+    """
+    iter_induced_velocity through a VortexTree, built once and evaluated tile by tile
+    """
+    with stage("induced_velocity"):
+        tree = VortexTree(x_vortex, y_vortex, scaled_strength, order)
+    n_points = len(x)
+    count("tree_points", n_points)
+    chunk_size = chunk_size or TREE_TILE_POINTS
+
+    vel_x = np.empty(n_points, dtype=dtype)
+    vel_y = np.empty(n_points, dtype=dtype)
+    for start in range(0, n_points, chunk_size):
+        checkpoint()
+        stop = min(start + chunk_size, n_points)
+        with stage("induced_velocity"):
+            vel_x[start:stop], vel_y[start:stop] = tree.velocity(x[start:stop], y[start:stop], theta)
+        yield start, stop, vel_x, vel_y
+
+
+class VortexTree:
+    """
+    Barnes-Hut style tree over point vortices for the induced velocity of many field points.
+
+    In complex form the induced velocity is u - iv = i * sum(s_k / (z - z_k)) with
+    s_k = strength / 2π. For a cluster centred at c with radius ρ and |z - c| > ρ this
+    is the multipole series i * sum_p a_p / (z - c)^(p + 1), a_p = sum_k s_k (z_k - c)^p,
+    so far-away clusters cost order + 1 terms instead of one term per vortex.
+    """
+
+    def __init__(self, x_vortex, y_vortex, scaled_strength, order=TREE_ORDER, leaf_size=TREE_LEAF_SIZE):
+        """
+        x_vortex, y_vortex : numpy array -> Vortex positions
+        scaled_strength : numpy array -> Circulation of each vortex divided by 2π
+        """
+        z = np.asarray(x_vortex, dtype=float) + 1j * np.asarray(y_vortex, dtype=float)
+        strength = np.asarray(scaled_strength, dtype=float)
+        self._powers = np.arange(order + 1)
+        self._leaf_size = leaf_size
+        self._nodes, self._centers, self._radii, self._moments = [], [], [], []
+        self._permutation = np.arange(len(z))
+        self._build(z, strength, 0, len(z))
+
+        # Node table: vortex range [start, stop) of the sorted arrays and children (-1 for leaves)
+        self.start, self.stop, self.left, self.right = np.array(self._nodes).T
+        self.centers = np.array(self._centers)
+        self.radii = np.array(self._radii)
+        self.moments = np.array(self._moments)
+        self.z = z[self._permutation]
+        self.strength = strength[self._permutation]
+
+    def _build(self, z, strength, start, stop):
+        """
+        Add the node holding vortices [start, stop) and, if it is too big, its two
+        halves split at the median of its longer side. Returns the node index.
+        """
+        members = self._permutation[start:stop]
+        points = z[members]
+        center = np.mean(points)
+
+        node = len(self._nodes)
+        self._nodes.append([start, stop, -1, -1])
+        self._centers.append(center)
+        self._radii.append(np.max(np.abs(points - center)))
+        self._moments.append(strength[members] @ (points - center)[:, None] ** self._powers)
+
+        if stop - start > self._leaf_size:
+            key = points.real if np.ptp(points.real) >= np.ptp(points.imag) else points.imag
+            self._permutation[start:stop] = members[np.argsort(key, kind="stable")]
+            middle = (start + stop) // 2
+            self._nodes[node][2] = self._build(z, strength, start, middle)
+            self._nodes[node][3] = self._build(z, strength, middle, stop)
+        return node
+
+    def velocity(self, x, y, theta=TREE_THETA):
+        """
+        Induced velocity at points (x, y). Nodes with radius < theta * distance use
+        their multipole series, closer leaves are summed directly.
+        """
+        z = np.asarray(x, dtype=float) + 1j * np.asarray(y, dtype=float)
+        total = np.zeros(len(z), dtype=complex)  # sum(s_k / (z - z_k))
+
+        pending = [(0, np.arange(len(z)))]
+        while pending:
+            node, index = pending.pop()
+            distance = z[index] - self.centers[node]
+            far = self.radii[node] < theta * np.abs(distance)
+
+            if far.any():
+                # Horner evaluation of sum_p a_p t^(p + 1) with t = 1 / (z - c)
+                t = 1 / distance[far]
+                series = np.full(t.shape, self.moments[node, -1])
+                for moment in self.moments[node, -2::-1]:
+                    series = series * t + moment
+                total[index[far]] += series * t
+                index = index[~far]
+                if index.size == 0:
+                    continue
+
+            if self.left[node] < 0:
+                start, stop = self.start[node], self.stop[node]
+                total[index] += np.sum(self.strength[start:stop] / (z[index, None] - self.z[start:stop]), axis=1)
+            else:
+                pending.append((self.left[node], index))
+                pending.append((self.right[node], index))
+
+        # u - iv = i * total
+        return -total.imag, -total.real
@@ -1,121 +1,658 @@
 import numpy as np
+from functools import lru_cache
+from camberline import naca_camber_factors
+from camberSlope import camber_slope_at_x
+from instrumentation import count, timed, watch_cache
 
-def compute_A0(M, P, alpha):
+# Quadrature rules on [0, 1]: name -> function(order) returning (nodes, weights)
+QUADRATURE_RULES = {}
+
+
+def quadrature_rule(name):
     """
-    Compute the value of A0 , the fourier constant used in our thin airfoil theory derivation
+    Registers a quadrature rule under name in QUADRATURE_RULES
     """
-    points_integration = np.linspace(0, np.pi, 1001)  
-    x = (1 - np.cos(points_integration)) / 2  # Compute x values
+    def register(rule):
+        QUADRATURE_RULES[name] = rule
+        return rule
+    return register
 
-    # Compute dz/dx using vectorized approach
-    dz_dx = np.where(x < P, (2 * M / P**2) * (P - x), (2 * M / (1 - P)**2) * (P - x))
-    
-    #Integrating using trapezoid
-    integral = np.trapz(dz_dx, points_integration)
-    
-    # Compute A0
-    A0 = alpha - integral / np.pi  
-    return A0
 
-def compute_An(M,P,n):  
+@quadrature_rule("trapezoid")
+def _trapezoid_nodes(order):
+    nodes = np.linspace(0, 1, order)
+    weights = np.full(order, 1 / (order - 1))
+    weights[[0, -1]] /= 2
+    return nodes, weights
+
+
+@quadrature_rule("gauss-chebyshev")
+def _gauss_chebyshev_nodes(order):
+    # In θ the Chebyshev-Gauss nodes are equally spaced midpoints with equal weights
+    nodes = (np.arange(order) + 0.5) / order
+    return nodes, np.full(order, 1 / order)
+
+
+@quadrature_rule("clenshaw-curtis")
+def _clenshaw_curtis_nodes(order):
+    n = order - 1
+    angles = np.pi * np.arange(order) / n
+    weights = np.zeros(order)
+    inner = np.ones(n - 1)
+    for k in range(1, (n - 1) // 2 + 1):
+        inner -= 2 * np.cos(2 * k * angles[1:-1]) / (4 * k**2 - 1)
+    if n % 2 == 0:
+        inner -= np.cos(n * angles[1:-1]) / (n**2 - 1)
+        weights[[0, -1]] = 1 / (n**2 - 1)
+    else:
+        weights[[0, -1]] = 1 / n**2
+    weights[1:-1] = 2 * inner / n
+    return (1 - np.cos(angles)) / 2, weights / 2
+
+
+@quadrature_rule("gauss-legendre")
+def _gauss_legendre_nodes(order):
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    return (nodes + 1) / 2, weights / 2
+
+
+# Integration grids in theta: (rule, order, start, stop)
+NACA_GRID = ("trapezoid", 1001, 0, np.pi)
+POLY_GRID = ("trapezoid", 1000, 0.01, np.pi - 0.01)  # Ignoring points near the edges
+
+
+@lru_cache(maxsize=None)
+def _reference_rule(rule, order):
     """
-    Compute the value of An , the fourier constant used in our thin airfoil theory derivation
+    Nodes and weights of a registered rule on [0, 1], built once and shared read-only
+    """
+    if rule not in QUADRATURE_RULES:
+        raise ValueError(f"Unknown quadrature rule: {rule}, choose from {tuple(QUADRATURE_RULES)}")
+    if order < 2:
+        raise ValueError(f"Quadrature order must be at least 2, got {order}")
+    nodes, weights = QUADRATURE_RULES[rule](order)
+    for array in (nodes, weights):
+        array.flags.writeable = False
+    return nodes, weights
+
+
+@watch_cache("quadrature_grids")
+@lru_cache(maxsize=None)
+def get_quadrature(rule, order, start=0, stop=np.pi):
+    """
+    Quadrature nodes theta, chordwise positions x and weights on [start, stop],
+    built once per grid and shared read-only
+
+    Parameters:
+    rule : str -> Any of QUADRATURE_RULES
+    order : int -> Number of nodes
+    start, stop : float -> Theta interval
+
+    Returns:
+    theta, x, weights : numpy array -> Read-only arrays of length order
+    """
+    nodes, weights = _reference_rule(rule, order)
+    theta = start + (stop - start) * nodes
+    x = (1 - np.cos(theta)) / 2  # Compute x values
+    weights = (stop - start) * weights
+    for array in (theta, x, weights):
+        array.flags.writeable = False
+    return theta, x, weights
+
+
+def _grid(quadrature, default):
+    """
+    The grid key for a quadrature argument: None gives default, (rule, order) covers [0, π]
+    and (rule, order, start, stop) is used as is
+    """
+    if quadrature is None:
+        return default
+    grid = tuple(quadrature)
+    if len(grid) == 2:
+        grid += (0, np.pi)
+    _reference_rule(*grid[:2])  # Validates the rule and order
+    return grid
+
+
+@watch_cache("cosine_tables")
+@lru_cache(maxsize=32)
+def _cosine_table(grid, n_max):
+    """
+    Weighted cos(nθ) table of shape (n_max + 1, len(theta)), so that
+    table @ f integrates f(θ)cos(nθ) for every n = 0..n_max at once
+    """
+    theta, _, weights = get_quadrature(*grid)
+    table = np.cos(np.outer(np.arange(n_max + 1), theta)) * weights
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=8)
+def _cumulative_cosine_tables(grid, n_max):
+    """
+    Running sums of the weighted cos(nθ) table and of x times it, with a leading
+    zero column. Entry [n, k] is the quadrature over the first k nodes, so the
+    front section (x < P) of any airfoil is a single lookup.
+    """
+    _, x, _ = get_quadrature(*grid)
+    table = _cosine_table(grid, n_max)
+    zeros = np.zeros((n_max + 1, 1))
+    cumulative = np.hstack((zeros, np.cumsum(table, axis=1)))
+    cumulative_x = np.hstack((zeros, np.cumsum(table * x, axis=1)))
+    for array in (cumulative, cumulative_x):
+        array.flags.writeable = False
+    return cumulative, cumulative_x
+
+
+@lru_cache(maxsize=256)
+def _cosine_row(grid, n):
+    """
+    Weighted cos(nθ) row for a single n, see _cosine_table
+    """
+    theta, _, weights = get_quadrature(*grid)
+    row = np.cos(n * theta) * weights
+    row.flags.writeable = False
+    return row
+
+
+def _split_quadrature(grid, P):
+    """
+    The rule of grid applied separately on [start, θ_P] and [θ_P, stop], where
+    θ_P = arccos(1 - 2P) is the kink of the NACA camber slope. Each side is smooth,
+    so Gauss-type rules converge spectrally instead of at the O(h^2) the kink allows.
+    """
+    rule, order, start, stop = grid
+    theta_p = np.clip(np.arccos(1 - 2 * P), start, stop)
+    nodes, weights = _reference_rule(rule, order)
+    theta = np.concatenate((start + (theta_p - start) * nodes, theta_p + (stop - theta_p) * nodes))
+    weights = np.concatenate(((theta_p - start) * weights, (stop - theta_p) * weights))
+    return theta, (1 - np.cos(theta)) / 2, weights
+
+
+def _sine_integral(m, t):
+    """
+    Integral of cos(mθ) from 0 to t, for integer arrays m (m = 0 included)
+    """
+    safe_m = np.where(m == 0, 1, m)
+    return np.where(m == 0, t, np.sin(m * t) / safe_m)
+
+
+def _naca_cosine_integrals(M, P, n):
     """
-    points_integration = np.linspace(0, np.pi, 1001)  
-    x = (1 - np.cos(points_integration)) / 2  # Compute x values
+    Exact integrals of dz/dx * cos(nθ) over [0, π] for the NACA 4-digit camber line.
 
-    # Compute dz/dx using vectorized approach
-    dz_dx = np.where(x < P, (2 * M / P**2) * (P - x), (2 * M / (1 - P)**2) * (P - x))
+    With x = (1 - cosθ)/2 the slope is (k/2)(cosθ - cosθ_P) on both sides of
+    θ_P = arccos(1 - 2P), where k = 2M/P^2 in front and 2M/(1 - P)^2 behind,
+    so every integral is a combination of sin(mθ)/m terms evaluated at θ_P and π.
+    M and P may be arrays, the n axis is appended last.
+    """
+    n = np.asarray(n)
+    M = np.asarray(M, dtype=float)[..., None]
+    P = np.asarray(P, dtype=float)[..., None]
+    cos_p = 1 - 2 * P
+    theta_p = np.arccos(cos_p)
+
+    def antiderivative(t):
+        # Integral of (cosθ - cosθ_P) cos(nθ) / 2 from 0 to t
+        cos_cos = (_sine_integral(n - 1, t) + _sine_integral(n + 1, t)) / 2
+        return (cos_cos - cos_p * _sine_integral(n, t)) / 2
+
+    front_k, back_k = _naca_slope_factors(M, P)
+    at_p = antiderivative(theta_p)
+    integrals = front_k * at_p + back_k * (antiderivative(np.pi) - at_p)
+    return integrals[..., 0] if n.ndim == 0 else integrals
 
-    # Compute cos(nθ) term
-    cos_n_theta = np.cos(n * points_integration)
+
+def _naca_slope_factors(M, P):
+    """
+    Slope factors 2M/P^2 (front) and 2M/(1 - P)^2 (back). A section that is empty
+    (P = 0 or P = 1) gets a factor of 0 instead of a division by zero.
+    """
+    front, back = naca_camber_factors(M, P)
+    return 2 * front, 2 * back
 
 
-    integral = np.trapz(dz_dx * cos_n_theta, points_integration)
+def _coefficients_from_slope(dz_dx, grid, alpha, n_max):
+    """
+    Turn camber slope samples on a theta grid into [A0, A1, ..., A_n_max]
+    with a single matrix product
+    """
+    integrals = _cosine_table(grid, n_max) @ dz_dx
+    return _coefficients_from_integrals(integrals, alpha)
+
+
+def _coefficients_from_integrals(integrals, alpha):
+    """
+    Turn the integrals of dz/dx * cos(nθ) for n = 0..N into [A0, A1, ..., A_N]
+    """
+    coefficients = (2 / np.pi) * integrals
+    coefficients[0] = alpha - integrals[0] / np.pi
+    return coefficients
+
+
+def sum_sine_series(coefficients, theta):
+    """
+    Sum A_n sin(nθ) for n = 1..len(coefficients)-1, the camber part of the
+    circulation distribution
+
+    Parameters:
+    coefficients : numpy array -> [A0, A1, ..., A_N] (A0 is not used)
+    theta : float or numpy array -> Angular positions along the chord
+
+    Returns:
+    Sum : float or numpy array -> Same shape as theta
+    """
+    n = np.arange(1, len(coefficients))
+    return np.sin(np.multiply.outer(theta, n)) @ coefficients[1:]
+
+
+@timed("coefficients")
+def compute_fourier_coefficients(M, P, alpha, n_max, method="trapezoid", quadrature=None, split=False):
+    """
+    Compute the fourier constants A0, A1, ..., A_n_max in one pass. The camber slope
+    is evaluated once and every coefficient comes from one product against a
+    precomputed cos(nθ) table.
+
+    Parameters:
+    M : float -> Maximum camber
+    P : float -> Position of maximum camber
+    alpha : float -> Angle of attack (in radians)
+    n_max : int -> Highest fourier coefficient index
+    method : str -> "trapezoid" (quadrature, by default the 1001-point trapezoid grid) or
+                    "analytic" (exact closed form, no grid)
+    quadrature : tuple -> (rule, order) over [0, π] or (rule, order, start, stop),
+                          rule is any of QUADRATURE_RULES (default: NACA_GRID)
+    split : bool -> Apply the rule on each side of the kink at x = P, so that
+                    e.g. ("gauss-legendre", 16) reaches machine precision
+
+    Returns:
+    coefficients : numpy array -> [A0, A1, ..., A_n_max]
+    """
+    if method == "analytic":
+        integrals = _naca_cosine_integrals(M, P, np.arange(n_max + 1))
+        return _coefficients_from_integrals(integrals, alpha)
+    if method != "trapezoid":
+        raise ValueError(f"Unknown method: {method}")
+
+    grid = _grid(quadrature, NACA_GRID)
+    count("quadrature_evaluations", n_max + 1)
+    if split:
+        theta, x, weights = _split_quadrature(grid, P)
+        integrals = (np.cos(np.outer(np.arange(n_max + 1), theta)) * weights) @ camber_slope_at_x(M, P, x)
+        return _coefficients_from_integrals(integrals, alpha)
+
+    _, x, _ = get_quadrature(*grid)
+    dz_dx = camber_slope_at_x(M, P, x)
+    return _coefficients_from_slope(dz_dx, grid, alpha, n_max)
+
+
+@timed("coefficients")
+def compute_naca_batch(M, P, alpha, method="trapezoid", quadrature=None):
+    """
+    Evaluates a family of NACA 4-digit airfoils at once. M, P and alpha are
+    broadcast against each other, so grids such as M[:, None, None], P[None, :, None]
+    and alpha[None, None, :] work without any Python loop per airfoil.
+
+    The coefficients only depend on (M, P) and alpha only shifts A0. With the
+    trapezoid method every airfoil shares one theta grid, and the piecewise slope
+    integral reduces to running sums of the cos(nθ) table up to the node where x = P.
+
+    Parameters:
+    M : array-like -> Maximum camber
+    P : array-like -> Position of maximum camber
+    alpha : array-like -> Angle of attack (in radians)
+    method : str -> "trapezoid" or "analytic", see compute_fourier_coefficients
+    quadrature : tuple -> Shared theta grid, see compute_fourier_coefficients
+
+    Returns:
+    results : dict -> "Cl", "Cm_c4", "A0", "A1", "A2" arrays of the broadcast shape
+    """
+    M, P = np.broadcast_arrays(np.asarray(M, dtype=float), np.asarray(P, dtype=float))
+
+    if method == "analytic":
+        integrals = _naca_cosine_integrals(M, P, np.arange(3))
+    elif method == "trapezoid":
+        grid = _grid(quadrature, NACA_GRID)
+        count("quadrature_evaluations", 3 * M.size)
+        _, x, _ = get_quadrature(*grid)
+        cumulative, cumulative_x = _cumulative_cosine_tables(grid, 2)
+        split = np.searchsorted(x, P)  # Number of nodes with x < P
+        front = P[..., None] * cumulative.T[split] - cumulative_x.T[split]
+        back = (P[..., None] * cumulative[:, -1] - cumulative_x[:, -1]) - front
+        front_k, back_k = _naca_slope_factors(M, P)
+        integrals = front_k[..., None] * front + back_k[..., None] * back
+    else:
+        raise ValueError(f"Unknown method: {method}")
+
+    A0 = alpha - integrals[..., 0] / np.pi
+    A1 = (2 / np.pi) * integrals[..., 1]
+    A2 = (2 / np.pi) * integrals[..., 2]
+    A0, A1, A2 = (A[()] for A in np.broadcast_arrays(A0, A1, A2))  # Plain floats for scalar input
+
+    return {
+        "Cl": np.pi * (2 * A0 + A1),
+        "Cm_c4": (np.pi / 4) * (A2 - A1),
+        "A0": A0,
+        "A1": A1,
+        "A2": A2,
+    }
+
+
+def compute_A0(M, P, alpha, method="trapezoid", quadrature=None, split=False):
+    """
+    Compute the value of A0 , the fourier constant used in our thin airfoil theory derivation
+    """
+    return compute_fourier_coefficients(M, P, alpha, 0, method, quadrature, split)[0]
+
+@timed("coefficients")
+def compute_An(M,P,n, method="trapezoid", quadrature=None, split=False):  
+    """
+    Compute the value of An , the fourier constant used in our thin airfoil theory derivation
+    """
+    if method == "analytic":
+        return (2 / np.pi) * _naca_cosine_integrals(M, P, n)
+    if method != "trapezoid":
+        raise ValueError(f"Unknown method: {method}")
+
+    grid = _grid(quadrature, NACA_GRID)
+    count("quadrature_evaluations")
+    if split:
+        theta, x, weights = _split_quadrature(grid, P)
+        row = weights * np.cos(n * theta)
+    else:
+        _, x, _ = get_quadrature(*grid)
+        row = _cosine_row(grid, n)
+    dz_dx = camber_slope_at_x(M, P, x)
+
+    # Integrating dz/dx * cos(nθ) with the quadrature weights
+    integral = row @ dz_dx
 
     # Compute An
     An = (2 / np.pi) * integral  
     return An
 
-def compute_Cl(M,P, alpha):
+def compute_Cl(M,P, alpha, method="trapezoid", quadrature=None, split=False):
     """
     Computes the lift coefficient Cl for a thin airfoil.
 
+    method : str -> "trapezoid" or "analytic", see compute_fourier_coefficients
+    quadrature, split : see compute_fourier_coefficients
+
     Returns:
     Cl : float -> Lift coefficient
     """
-
-    
-    A0 = compute_A0(M, P, alpha)
-    A1 = compute_An(M, P, 1)  # Only A1 is needed
+    A0, A1 = compute_fourier_coefficients(M, P, alpha, 1, method, quadrature, split)  # Only A1 is needed
     
     Cl = np.pi * (2 * A0 + A1)
     return Cl
 
 
+def _lift_polar(coefficients, alphas):
+    """
+    Cl over alphas from the alpha = 0 coefficients [A0, A1]. Only A0 depends on
+    alpha (A0 = alpha + A0(0)), so Cl = 2π(alpha - alpha_L0).
+    """
+    A0, A1 = coefficients
+    lift_slope = 2 * np.pi  # dCl/dalpha per radian
+    alpha_zero_lift = -(A0 + A1 / 2)
+    Cl = lift_slope * (np.asarray(alphas) - alpha_zero_lift)
+    return Cl, alpha_zero_lift, lift_slope
 
-def compute_A0_poly(coeffs, alpha):
+def compute_Cl_sweep(M, P, alphas, method="trapezoid", quadrature=None, split=False):
+    """
+    Computes the lift coefficient for an array of angles of attack from a single
+    coefficient evaluation.
+
+    Parameters:
+    M : float -> Maximum camber
+    P : float -> Position of maximum camber
+    alphas : array-like -> Angles of attack (in radians)
+    method : str -> "trapezoid" or "analytic", see compute_fourier_coefficients
+    quadrature, split : see compute_fourier_coefficients
+
+    Returns:
+    Cl : numpy array -> Lift coefficient at each alpha
+    alpha_zero_lift : float -> Zero-lift angle (in radians)
+    lift_slope : float -> Lift-curve slope dCl/dalpha (per radian)
+    """
+    return _lift_polar(compute_fourier_coefficients(M, P, 0, 1, method, quadrature, split), alphas)
+
+
+
+LOAD_TERMS = 99  # Fourier terms A1..A99 in the NACA pressure distribution, as in the default SolverConfig
+
+
+def loads_from_coefficients(coefficients, alphas, x=None):
+    """
+    Aerodynamic loads from the alpha = 0 coefficients [A0, A1, ..., A_N] for every alpha.
+    Only A0 depends on alpha, so a sweep costs a few array operations and no new
+    coefficients or gamma evaluations.
+
+    Cl = π(2A0 + A1)
+    Cm_le = -π/2 (A0 + A1 - A2/2)
+    Cm_c4 = π/4 (A2 - A1)
+    x_cp = -Cm_le / Cl = 1/4 (1 + π(A1 - A2) / Cl)
+    ΔCp(x) = 4 (A0 cot(θ/2) + sum A_n sin(nθ)), with cot(θ/2) = sqrt((1 - x) / x)
+
+    Parameters:
+    coefficients : numpy array -> [A0, A1, ..., A_N] at alpha = 0 (missing A1, A2 count as 0)
+    alphas : float or array-like -> Angles of attack (in radians)
+    x : array-like -> Chordwise positions for ΔCp (default: no pressure distribution)
+
+    Returns:
+    loads : dict -> "Cl", "Cm_le", "Cm_c4" and "x_cp" with the shape of alphas (x_cp is nan
+                    where Cl = 0), and "delta_Cp" of shape alphas.shape + x.shape when x is given
+                    (lower minus upper surface pressure coefficient, infinite at the leading edge)
+    """
+    coefficients = np.asarray(coefficients, dtype=float)
+    A1, A2 = (coefficients[n] if len(coefficients) > n else 0.0 for n in (1, 2))
+    A0 = np.asarray(alphas, dtype=float) + coefficients[0]
+
+    Cl = np.pi * (2 * A0 + A1)
+    Cm_le = -(np.pi / 2) * (A0 + A1 - A2 / 2)
+    loads = {
+        "Cl": Cl,
+        "Cm_le": Cm_le,
+        "Cm_c4": np.full(A0.shape, (np.pi / 4) * (A2 - A1))[()],
+        "x_cp": np.divide(-Cm_le, Cl, out=np.full(A0.shape, np.nan), where=Cl != 0)[()],
+    }
+
+    if x is not None:
+        x = np.asarray(x, dtype=float)
+        with np.errstate(divide="ignore"):
+            cot_half = np.sqrt((1 - x) / x)  # (1 + cosθ) / sinθ, inf at the leading edge
+        camber = 4 * sum_sine_series(coefficients, np.arccos(1 - 2 * x))
+        loads["delta_Cp"] = 4 * np.multiply.outer(A0, cot_half) + camber
+    return loads
+
+
+def compute_loads(M, P, alphas, x=None, method="trapezoid", n_max=LOAD_TERMS):
+    """
+    Computes Cl, Cm_le, Cm_c4, the centre of pressure x_cp and optionally ΔCp(x) for a
+    NACA 4-digit airfoil at every angle of attack in one call.
+
+    Parameters:
+    M : float -> Maximum camber
+    P : float -> Position of maximum camber
+    alphas : float or array-like -> Angles of attack (in radians)
+    x : array-like -> Chordwise positions for ΔCp (default: no pressure distribution)
+    method : str -> "trapezoid" or "analytic", see compute_fourier_coefficients
+    n_max : int -> Fourier terms in ΔCp (the moments only need A0, A1 and A2)
+
+    Returns:
+    loads : dict -> See loads_from_coefficients
+    """
+    n_max = n_max if x is not None else 2
+    return loads_from_coefficients(compute_fourier_coefficients(M, P, 0, n_max, method), alphas, x)
+
+
+@lru_cache(maxsize=None)
+def _cosine_series_matrix(degree):
+    """
+    Matrix taking the power coefficients [b_0, ..., b_degree] of a slope in x to its
+    cosine series in θ, built once per degree and shared read-only
+    """
+    half = np.polynomial.Polynomial([0.5, -0.5])  # x = (1 - t)/2 with t = cosθ
+    matrix = np.zeros((degree + 1, degree + 1))
+    for k in range(degree + 1):
+        matrix[:k + 1, k] = np.polynomial.chebyshev.poly2cheb((half**k).coef)
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _poly_cosine_series(coeffs):
+    """
+    Cosine series of a polynomial camber slope. With x = (1 - cosθ)/2 the slope
+    p'(x) is a polynomial in cosθ, and its Chebyshev coefficients c_n are exactly
+    its cos(nθ) coefficients, so A0 = alpha - c_0, A_n = c_n and A_n = 0 beyond
+    the degree of p'. No quadrature and no truncated endpoints are involved.
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    degree = len(coeffs) - 1
+    if degree < 1:
+        return np.zeros(1)  # Constant camber, zero slope
+    slope = coeffs[:-1] * np.arange(degree, 0, -1)  # p'(x), highest order first
+    return _cosine_series_matrix(degree - 1) @ slope[::-1]
+
+
+def poly_fourier_order(coeffs):
+    """
+    Highest n with a possibly nonzero A_n for a polynomial camber line [a_n, ..., a_1, a_0],
+    the degree of its slope. Every A_n beyond it is exactly zero.
+    """
+    return max(len(coeffs) - 2, 0)
+
+
+@timed("coefficients")
+def compute_fourier_coefficients_poly(coeffs, alpha, n_max, method="chebyshev", quadrature=None):
+    """
+    Compute A0, A1, ..., A_n_max in one pass for a user-defined polynomial camber function.
+
+    Parameters:
+    coeffs : list -> Coefficients of the polynomial [a_n, ..., a_1, a_0] (highest order first)
+    alpha : float -> Angle of attack (in radians)
+    n_max : int -> Highest fourier coefficient index
+    method : str -> "chebyshev" (exact cosine series of the slope, no grid) or
+                    "trapezoid" (quadrature, by default the 1000-point trapezoid grid)
+    quadrature : tuple -> (rule, order) over [0, π] or (rule, order, start, stop),
+                          rule is any of QUADRATURE_RULES (default: POLY_GRID). The slope is
+                          smooth, so ("gauss-chebyshev", 64) is exact for moderate degrees.
+
+    Returns:
+    coefficients : numpy array -> [A0, A1, ..., A_n_max]
+    """
+    if method == "chebyshev":
+        series = _poly_cosine_series(coeffs)[:n_max + 1]
+        coefficients = np.zeros(n_max + 1)
+        coefficients[:len(series)] = series
+        coefficients[0] = alpha - series[0]
+        return coefficients
+    if method != "trapezoid":
+        raise ValueError(f"Unknown method: {method}")
+
+    grid = _grid(quadrature, POLY_GRID)
+    count("quadrature_evaluations", n_max + 1)
+    _, x, _ = get_quadrature(*grid)
+    dz_dx = np.polyval(np.polyder(coeffs), x)  # Slope of the camber function
+    return _coefficients_from_slope(dz_dx, grid, alpha, n_max)
+
+
+def compute_A0_poly(coeffs, alpha, method="chebyshev", quadrature=None):
     """
     Compute A0 coefficient using a user-defined polynomial camber function.
 
     Parameters:
     coeffs : list -> Coefficients of the polynomial [a_n, ..., a_1, a_0] (highest order first)
     alpha : float -> Angle of attack in degrees
+    method, quadrature : see compute_fourier_coefficients_poly
 
     Returns:
     A0 : float
     """
-    theta = np.linspace(0.01, np.pi-0.01, 1000)  # Higher precision
-    x = (1 - np.cos(theta)) / 2  # Transform to x-coordinates
-    
-    poly_derivative = np.polyder(coeffs)  # Differentiate camber function
-    dz_dx = np.polyval(poly_derivative, x)  # Evaluate slope at x values
-
-    integral = np.trapz(dz_dx, theta)  # Numerical integration
-    A0 = alpha - (1 / np.pi) * integral
-    return A0
+    return compute_fourier_coefficients_poly(coeffs, alpha, 0, method, quadrature)[0]
 
-def compute_An_poly(coeffs, n):
+@timed("coefficients")
+def compute_An_poly(coeffs, n, method="chebyshev", quadrature=None):
     """
     Compute An coefficients for a user-defined polynomial camber function.
 
     Parameters:
     coeffs : list -> Coefficients of the polynomial [a_n, ..., a_1, a_0] (highest order first)
     n : int -> Fourier coefficient index
+    method, quadrature : see compute_fourier_coefficients_poly
 
     Returns:
     An : float
     """
-    theta = np.linspace(0.01, np.pi-0.01, 1000)  # Higher precision
-    x = (1 - np.cos(theta)) / 2  # Transform to x-coordinates
+    if method == "chebyshev":
+        series = _poly_cosine_series(coeffs)
+        if n >= len(series):
+            return 0.0  # Zero beyond the degree of the slope
+        return series[n] if n > 0 else 2 * series[0]  # (2/π) times the integral of dz/dx is 2c_0
+    if method != "trapezoid":
+        raise ValueError(f"Unknown method: {method}")
+
+    grid = _grid(quadrature, POLY_GRID)
+    count("quadrature_evaluations")
+    _, x, _ = get_quadrature(*grid)
     
     poly_derivative = np.polyder(coeffs)  # Differentiate camber function
     dz_dx = np.polyval(poly_derivative, x)  # Evaluate slope at x values
 
-    integrand = dz_dx * np.cos(n * theta)
-    integral = np.trapz(integrand, theta)  # Numerical integration
+    integral = _cosine_row(grid, n) @ dz_dx  # Numerical integration
     An = (2 / np.pi) * integral
     
     return An
 
-def compute_Cl_poly(coeffs, alpha):
+def compute_Cl_poly(coeffs, alpha, method="chebyshev", quadrature=None):
     """
     Computes the lift coefficient Cl for a user-defined polynomial camber airfoil.
 
     Parameters:
     coeffs : list -> Coefficients of the polynomial [a_n, ..., a_1, a_0] (highest order first)
     alpha : float -> Angle of attack in degrees
+    method, quadrature : see compute_fourier_coefficients_poly
 
     Returns:
     Cl : float -> Lift coefficient
     """
-    A0 = compute_A0_poly(coeffs, alpha)
-    A1 = compute_An_poly(coeffs, 1)  # Only A1 is needed
+    A0, A1 = compute_fourier_coefficients_poly(coeffs, alpha, 1, method, quadrature)  # Only A1 is needed
     
     Cl = np.pi * (2 * A0 + A1)
     return Cl
 
+def compute_Cl_poly_sweep(coeffs, alphas, method="chebyshev", quadrature=None):
+    """
+    Computes the lift coefficient of a polynomial camber airfoil for an array of
+    angles of attack from a single coefficient evaluation.
+
+    Parameters:
+    coeffs : list -> Coefficients of the polynomial [a_n, ..., a_1, a_0] (highest order first)
+    alphas : array-like -> Angles of attack (in radians)
+    method, quadrature : see compute_fourier_coefficients_poly
 
+    Returns:
+    Cl : numpy array -> Lift coefficient at each alpha
+    alpha_zero_lift : float -> Zero-lift angle (in radians)
+    lift_slope : float -> Lift-curve slope dCl/dalpha (per radian)
+    """
+    return _lift_polar(compute_fourier_coefficients_poly(coeffs, 0, 1, method, quadrature), alphas)
 
 
+def compute_loads_poly(coeffs, alphas, x=None, method="chebyshev"):
+    """
+    Computes Cl, Cm_le, Cm_c4, the centre of pressure x_cp and optionally ΔCp(x) for a
+    polynomial camber airfoil at every angle of attack in one call. With the default
+    method every A_n of the polynomial is exact, so ΔCp has no truncation error.
 
+    Parameters:
+    coeffs : list -> Coefficients of the polynomial [a_n, ..., a_1, a_0] (highest order first)
+    alphas : float or array-like -> Angles of attack (in radians)
+    x : array-like -> Chordwise positions for ΔCp (default: no pressure distribution)
+    method : str -> "chebyshev" or "trapezoid", see compute_fourier_coefficients_poly
+
+    Returns:
+    loads : dict -> See loads_from_coefficients
+    """
+    n_max = max(poly_fourier_order(coeffs), 2) if method == "chebyshev" or x is None else LOAD_TERMS
+    return loads_from_coefficients(compute_fourier_coefficients_poly(coeffs, 0, n_max, method), alphas, x)
@@ -1,5 +1,7 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from camberline import naca_camber_factors, naca_front
+
+
 def camber_slope_at_x(M,P, x_point):
     """
     Computes the slope dy_c/dx of the camber line at a specific x position.
@@ -10,13 +12,57 @@ def camber_slope_at_x(M,P, x_point):
     x_point : float -> Specific chordwise position (0 to 1), or an Array
 
     Returns:
-    dy_c_dx : float -> Slope of the camber line at x_point
+    dy_c_dx : float -> Slope of the camber line at x_point, same shape as x_point
+    """
+    front, back = naca_camber_factors(M, P)
+    x_point = np.asarray(x_point, dtype=float)
+
+    # Compute slope based on x position, 2M/P^2 (P - x) in front and 2M/(1 - P)^2 (P - x) behind
+    dy_c_dx = np.where(naca_front(x_point, P), 2 * front, 2 * back) * (P - x_point)
+
+    return dy_c_dx[()]  # Plain float for scalar input
+
+
+def camber_second_derivative_at_x(M, P, x_point):
+    """
+    Computes d²y_c/dx² of the camber line, -2M/P^2 in front of P and -2M/(1 - P)^2 behind it.
+
+    Parameters:
+    M = Max Camber
+    P = Position of Max Camber
+    x_point : float -> Chordwise position (0 to 1), or an Array
+
+    Returns:
+    d2y_c_dx2 : float -> Second derivative at x_point, same shape as x_point
     """
-    # Compute slope based on x position
-    if x_point < P:
-        dy_c_dx = (2 * M / P**2) * (P - x_point)
-    else:
-        dy_c_dx = (2 * M / (1 - P)**2) * (P - x_point)
+    front, back = naca_camber_factors(M, P)
+    x_point = np.asarray(x_point, dtype=float)
+    return (-2 * np.where(naca_front(x_point, P), front, back))[()]
 
-    return dy_c_dx
 
+def poly_slope_at_x(coeffs, x_point):
+    """
+    Computes the slope of a polynomial camber line [a_n, ..., a_1, a_0] (highest order first).
+
+    Parameters:
+    coeffs : list -> Coefficients of the polynomial
+    x_point : float -> Chordwise position (0 to 1), or an Array
+
+    Returns:
+    dy_c_dx : float -> Slope at x_point, same shape as x_point
+    """
+    return np.polyval(np.polyder(coeffs), x_point)
+
+
+def poly_second_derivative_at_x(coeffs, x_point):
+    """
+    Computes d²y_c/dx² of a polynomial camber line [a_n, ..., a_1, a_0] (highest order first).
+
+    Parameters:
+    coeffs : list -> Coefficients of the polynomial
+    x_point : float -> Chordwise position (0 to 1), or an Array
+
+    Returns:
+    d2y_c_dx2 : float -> Second derivative at x_point, same shape as x_point
+    """
+    return np.polyval(np.polyder(coeffs, 2), x_point)
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 def camber_line(x, M, P):
@@ -15,11 +14,34 @@ def camber_line(x, M, P):
     y_c : numpy array -> Camber line values
     dy_c_dx : numpy array -> Slope of camber line
     """
+    front, back = naca_camber_factors(M, P)
     y_c = np.where(
-        x < P, # codition of being less than p 
-        (M / P**2) * (2 * P * x - x**2),  
+        naca_front(x, P), # codition of being less than p 
+        front * (2 * P * x - x**2),  
         # Back section (P ≤ x ≤ 1)
-        (M / (1 - P)**2) * (1 - 2 * P + 2 * P * x - x**2)
+        back * (1 - 2 * P + 2 * P * x - x**2)
     )
 
     return y_c
+
+
+def naca_camber_factors(M, P):
+    """
+    Camber factors M/P^2 (front section) and M/(1 - P)^2 (back section). A section
+    that is empty (P = 0 or P = 1) gets a factor of 0 instead of a division by zero.
+    """
+    if np.ndim(M) == 0 and np.ndim(P) == 0:
+        return (M / P**2 if P > 0 else 0.0), (M / (1 - P)**2 if P < 1 else 0.0)
+    M = np.asarray(M, dtype=float)
+    P = np.asarray(P, dtype=float)
+    shape = np.broadcast_shapes(M.shape, P.shape)
+    front = np.divide(M, P**2, out=np.zeros(shape), where=P > 0)
+    back = np.divide(M, (1 - P)**2, out=np.zeros(shape), where=P < 1)
+    return front, back
+
+
+def naca_front(x, P):
+    """
+    True where x lies in the front section, x < P (the whole chord when P = 1)
+    """
+    return (np.asarray(x) < P) | (np.asarray(P) >= 1)
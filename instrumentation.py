@@ -0,0 +1,127 @@
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+# Opt-in solver metrics. Hooks in the compute modules cost a single check while no
+# instrument() block is active on the current thread.
+
+_state = threading.local()  # Per thread: active metrics dicts and the stack of running stages
+_watched_caches = {}  # name -> lru_cache wrapped function, see watch_cache
+_NO_STAGE = nullcontext()
+
+
+def _collectors():
+    return getattr(_state, "collectors", ())
+
+
+@contextmanager
+def instrument():
+    """
+    Collects solver metrics for everything run inside the block on this thread:
+
+        with instrument() as metrics:
+            compute_circulation(0.02, 0.4, 0.05)
+
+    metrics is a plain dict (JSON friendly), filled while the block runs:
+    "counts" : {name: n} -> Event counters, e.g. "quadrature_evaluations"
+    "stages" : {name: {"calls", "seconds", "self_seconds"}} -> Wall time per stage
+               ("coefficients", "gamma", "induced_velocity", "integration", ...), seconds
+               includes nested stages and self_seconds excludes them
+    "caches" : {name: {"hits", "misses"}} -> Cache activity, filled when the block ends
+               (the caches are shared, so other threads' lookups are included)
+    """
+    metrics = {"counts": {}, "stages": {}, "caches": {}}
+    start = {name: function.cache_info() for name, function in _watched_caches.items()}
+    _state.collectors = _collectors() + (metrics,)
+    try:
+        yield metrics
+    finally:
+        _state.collectors = tuple(c for c in _collectors() if c is not metrics)
+        for name, function in _watched_caches.items():
+            info = function.cache_info()
+            before = start.get(name)
+            metrics["caches"][name] = {
+                "hits": info.hits - (before.hits if before else 0),
+                "misses": info.misses - (before.misses if before else 0),
+            }
+
+
+def reset_instrumentation():
+    """
+    Drops the instrument() blocks still active on this thread. For scripts that enter a
+    block by hand and can be interrupted before leaving it (e.g. a Streamlit rerun), so a
+    new run does not keep filling the metrics of an abandoned one.
+    """
+    _state.collectors = ()
+
+
+def count(name, n=1):
+    """
+    Adds n to the counter name of every active instrument() block
+    """
+    for metrics in _collectors():
+        metrics["counts"][name] = metrics["counts"].get(name, 0) + n
+
+
+def stage(name):
+    """
+    Context manager timing a stage, a no-op unless instrument() is active
+    """
+    return _Stage(name) if _collectors() else _NO_STAGE
+
+
+def timed(name):
+    """
+    Decorator timing every call of a function as the stage name
+    """
+    def decorate(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _collectors():
+                return function(*args, **kwargs)
+            with _Stage(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def watch_cache(name):
+    """
+    Decorator reporting the hits and misses of an lru_cache wrapped function under name
+    """
+    def register(function):
+        _watched_caches[name] = function
+        return function
+    return register
+
+
+class _Stage:
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.collectors = _collectors()
+        self.children = 0.0
+        if not hasattr(_state, "stack"):
+            _state.stack = []
+        _state.stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        stack = _state.stack
+        stack.pop()
+        if stack:
+            stack[-1].children += elapsed
+        # A stage nested in itself (e.g. gamma inside gamma) only counts its outermost call
+        outermost = all(running.name != self.name for running in stack)
+
+        for metrics in self.collectors:
+            entry = metrics["stages"].setdefault(self.name, {"calls": 0, "seconds": 0.0, "self_seconds": 0.0})
+            entry["self_seconds"] += elapsed - self.children
+            if outermost:
+                entry["calls"] += 1
+                entry["seconds"] += elapsed
+        return False
@@ -0,0 +1,211 @@
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from instrumentation import instrument
+
+WORKERS = 2  # numpy and the numba kernel release the GIL, so threads run solver calls in parallel
+KEEP_FINISHED = 128  # Finished jobs kept for status queries and as results of repeated requests
+ACTIVE_STATES = ("queued", "running")
+
+
+class JobCancelled(Exception):
+    """
+    Raised inside a job by report_progress once the job has been cancelled
+    """
+
+
+_current = threading.local()  # The job run by this worker thread
+
+
+def report_progress(fraction, message=None):
+    """
+    Records the progress (0 to 1) of the job running on this thread and raises
+    JobCancelled when it has been cancelled. Does nothing outside a job, so compute
+    code can report unconditionally.
+    """
+    job = getattr(_current, "job", None)
+    if job is None:
+        return
+    job.progress = min(max(float(fraction), 0.0), 1.0)
+    if message is not None:
+        job.message = message
+    if job.cancel_requested:
+        raise JobCancelled(job.id)
+
+
+def checkpoint():
+    """
+    Raises JobCancelled when the job running on this thread has been cancelled, without
+    touching its progress. Called by long compute loops (e.g. the Biot-Savart tiles), so
+    any job stops within one tile. Does nothing outside a job.
+    """
+    job = getattr(_current, "job", None)
+    if job is not None and job.cancel_requested:
+        raise JobCancelled(job.id)
+
+
+class _Job:
+    def __init__(self, key, message):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.state = "queued"
+        self.progress = 0.0
+        self.message = message
+        self.result = None
+        self.error = None
+        self.metrics = None  # Solver metrics of the run (see instrumentation), set when it finishes
+        self.subscribers = 1  # Submissions sharing this job, it is cancelled when all of them cancel
+        self.cancel_requested = False
+        self.future = None
+
+
+class JobQueue:
+    """
+    Runs expensive calls on a background thread pool, so a UI thread only submits
+    and polls. Jobs have string ids, report progress through report_progress, can be
+    cancelled (immediately while queued, at the next report_progress or checkpoint while
+    running: velocity work stops within one Biot-Savart tile, short steps such as the
+    bound circulation integral finish first), and identical requests share one job, in
+    flight or recently finished. Every job
+    runs in its own instrument() block, as metrics are collected per thread.
+    """
+
+    def __init__(self, workers=WORKERS, keep_finished=KEEP_FINISHED):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self._keep_finished = keep_finished
+        self._jobs = OrderedDict()  # id -> _Job, in submission order
+        self._by_key = {}  # key -> id of the queued, running or done job
+        self._lock = threading.Lock()
+
+    def submit(self, function, *args, key=None, message=None, **kwargs):
+        """
+        Queues function(*args, **kwargs) and returns its job id. Calls with an equal key
+        (by default the function and its arguments, when hashable) return the id of the
+        existing job instead of running again, unless it failed or was cancelled.
+
+        Parameters:
+        function : callable -> The computation, may call report_progress
+        key : hashable -> Deduplication key (default: module, name and arguments of the call)
+        message : str -> Initial status message (default: the function name)
+        """
+        if key is None:
+            key = (function.__module__, function.__qualname__, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                key = None  # Unhashable arguments, never shared
+
+        with self._lock:
+            job_id = self._by_key.get(key) if key is not None else None
+            if job_id is not None:
+                job = self._jobs[job_id]
+                job.subscribers += 1
+                self._jobs.move_to_end(job_id)
+                return job_id
+
+            job = _Job(key, message or function.__name__)
+            self._jobs[job.id] = job
+            if key is not None:
+                self._by_key[key] = job.id
+            job.future = self._executor.submit(self._run, job, function, args, kwargs)
+            return job.id
+
+    def status(self, job_id):
+        """
+        Snapshot of a job: "id", "state" ("queued", "running", "done", "failed" or
+        "cancelled"), "progress" (0 to 1), "message", "result", "error" and "metrics"
+        (the instrument() metrics of the run, None until it finishes).
+        Raises KeyError for unknown or forgotten jobs.
+        """
+        with self._lock:
+            job = self._jobs[job_id]
+            return {"id": job.id, "state": job.state, "progress": job.progress, "message": job.message,
+                    "result": job.result, "error": job.error, "metrics": job.metrics}
+
+    def result(self, job_id, timeout=None):
+        """
+        Waits for a job and returns its result, raising its error (or JobCancelled)
+        """
+        with self._lock:
+            job = self._jobs[job_id]
+        if not job.future.cancelled():  # Jobs cancelled in the queue never ran
+            job.future.result(timeout)
+        if job.state == "failed":
+            raise job.error
+        if job.state == "cancelled":
+            raise JobCancelled(job.id)
+        return job.result
+
+    def cancel(self, job_id):
+        """
+        Withdraws one submission of a job. The job itself is cancelled once no submission
+        is left, returns whether that happened.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.state not in ACTIVE_STATES:
+                return False
+            job.subscribers -= 1
+            if job.subscribers > 0:
+                return False
+            job.cancel_requested = True
+            self._forget_key(job)
+            if job.future.cancel():
+                job.state = "cancelled"
+                self._prune()
+            return True
+
+    def shutdown(self, wait=True):
+        """
+        Cancels the queued jobs (marked "cancelled" at once), asks the running ones to
+        stop at their next checkpoint and stops the workers
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if job.state in ACTIVE_STATES:
+                    job.cancel_requested = True
+                    self._forget_key(job)
+                    if job.future.cancel():
+                        job.state = "cancelled"
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job, function, args, kwargs):
+        with self._lock:
+            if job.cancel_requested:
+                job.state = "cancelled"
+                return
+            job.state = "running"
+
+        _current.job = job
+        try:
+            with instrument() as metrics:
+                result = function(*args, **kwargs)
+        except JobCancelled:
+            state, result, error = "cancelled", None, None
+        except Exception as exception:
+            state, result, error = "failed", None, exception
+        else:
+            state, error = "done", None
+        finally:
+            _current.job = None
+
+        with self._lock:
+            job.state, job.result, job.error, job.metrics = state, result, error, metrics
+            if state == "done":
+                job.progress = 1.0
+            else:
+                self._forget_key(job)  # Failed or cancelled requests run again when resubmitted
+            self._prune()
+
+    def _forget_key(self, job):
+        if job.key is not None and self._by_key.get(job.key) == job.id:
+            del self._by_key[job.key]
+
+    def _prune(self):
+        """
+        Drops the oldest finished jobs beyond keep_finished
+        """
+        finished = [job_id for job_id, job in self._jobs.items() if job.state not in ACTIVE_STATES]
+        for job_id in finished[:max(len(finished) - self._keep_finished, 0)]:
+            self._forget_key(self._jobs.pop(job_id))
@@ -0,0 +1,251 @@
+import json
+import os
+import numpy as np
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows, appends are not locked across processes
+    fcntl = None
+
+KEY = ("M", "P", "alpha")  # Lookup columns, alpha in degrees like the CLI and app polars
+KEY_DECIMALS = 9  # Keys are rounded, so linspace round-off still finds its row
+CHUNK_ROWS = 65536  # Rows per chunk file, a float64 chunk is 512 kB
+POLAR_COLUMNS = ("Cl", "Cm_le", "Cm_c4", "x_cp")
+MODES = ("r", "a")
+
+
+class ResultStore:
+    """
+    Columnar result store on local disk, for sweeps that do not fit in memory.
+
+    Every column is a directory of fixed-size .npy chunks (path/<column>/000000.npy, ...)
+    preallocated with CHUNK_ROWS rows and memory-mapped on access, and schema.json
+    holds the dtypes, per-row shapes and the committed row count. Appends fill the
+    last chunk before starting a new one, reads map the chunks without copying, and
+    rows are found by their (M, P, alpha) key. Appends hold an exclusive lock on
+    schema.json.lock, so concurrent writers (e.g. several CLI runs on one store) queue
+    up instead of overwriting each other's rows. Readers never wait.
+    """
+
+    def __init__(self, path, columns=None, mode="r", key=KEY, chunk_rows=CHUNK_ROWS):
+        """
+        path : str -> Store directory
+        columns : dict -> name -> dtype or (dtype, row shape), needed to create a new store
+                          (the key columns default to float64)
+        mode : str -> "r" (read only) or "a" (append, creating the store if it does not exist)
+        key : tuple -> Columns identifying a row
+        chunk_rows : int -> Rows per chunk of a new store
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode}, choose from {MODES}")
+        self.path = Path(path)
+        self.mode = mode
+        if not (self.path / "schema.json").exists():
+            if mode == "r" or columns is None:
+                raise FileNotFoundError(f"No result store at {self.path}")
+            columns = {**{name: "float64" for name in key}, **columns}
+            self._schema = {
+                "columns": {name: _column_spec(spec) for name, spec in columns.items()},
+                "key": list(key),
+                "chunk_rows": chunk_rows,
+                "rows": 0,
+            }
+            self.path.mkdir(parents=True, exist_ok=True)
+            with self._write_lock():
+                if not (self.path / "schema.json").exists():  # Another writer may have created it meanwhile
+                    self._write_schema()
+        self._schema = json.loads((self.path / "schema.json").read_text())
+        self._maps = {}  # (column, chunk) -> read-only memmap of the whole chunk
+        self._index = None  # Sorted keys and their rows, built on the first lookup
+
+    @property
+    def columns(self):
+        return tuple(self._schema["columns"])
+
+    @property
+    def key(self):
+        return tuple(self._schema["key"])
+
+    def __len__(self):
+        return self._schema["rows"]
+
+    def __contains__(self, name):
+        return name in self._schema["columns"]
+
+    def __getitem__(self, name):
+        return self.column(name)
+
+    def append(self, data):
+        """
+        Appends rows. data maps every column to an array of rows, scalars (and single
+        rows of shaped columns) are broadcast. Rows are visible once the schema is rewritten.
+        """
+        if self.mode == "r":
+            raise ValueError(f"Result store {self.path} is opened read only")
+        missing = set(self.columns) - set(data)
+        if missing:
+            raise ValueError(f"Missing columns: {sorted(missing)}")
+        specs = self._schema["columns"]
+        n = max(np.shape(data[name])[0] if np.ndim(data[name]) > len(specs[name]["shape"]) else 1
+                for name in self.columns)
+
+        with self._write_lock():
+            self.refresh()  # Rows appended by other writers since this store was read
+            chunk_rows, start = self._schema["chunk_rows"], len(self)
+            for name, spec in specs.items():
+                values = np.broadcast_to(np.asarray(data[name], dtype=spec["dtype"]), (n, *spec["shape"]))
+                for chunk in range(start // chunk_rows, (start + n - 1) // chunk_rows + 1 if n else 0):
+                    lo, hi = max(start, chunk * chunk_rows), min(start + n, (chunk + 1) * chunk_rows)
+                    target = self._open_chunk(name, chunk, "r+")
+                    target[lo - chunk * chunk_rows:hi - chunk * chunk_rows] = values[lo - start:hi - start]
+                    target.flush()
+                    del target
+
+            self._schema["rows"] = start + n
+            self._write_schema()
+        self._index = None
+
+    def refresh(self):
+        """
+        Re-reads the schema, picking up rows appended by other writers
+        """
+        rows = len(self)
+        self._schema = json.loads((self.path / "schema.json").read_text())
+        if len(self) != rows:
+            self._index = None
+
+    def chunks(self, name):
+        """
+        The column as a list of read-only memory-mapped chunks, without copying
+        """
+        spec = self._schema["columns"][name]
+        chunk_rows, rows = self._schema["chunk_rows"], len(self)
+        views = []
+        for chunk in range(-(-rows // chunk_rows)):
+            if (name, chunk) not in self._maps:
+                self._maps[name, chunk] = self._open_chunk(name, chunk, "r")
+            views.append(self._maps[name, chunk][:min(chunk_rows, rows - chunk * chunk_rows)])
+        return views or [np.empty((0, *spec["shape"]), dtype=spec["dtype"])]
+
+    def column(self, name):
+        """
+        The whole column, a zero-copy memmap while the store fits in one chunk and a copy otherwise
+        """
+        views = self.chunks(name)
+        return views[0] if len(views) == 1 else np.concatenate(views)
+
+    def find(self, *key):
+        """
+        Rows of the given key values (broadcast against each other), -1 where no row
+        matches. Duplicate keys resolve to the most recently appended row.
+        """
+        sorted_keys, order = self._key_index()
+        query = _key_records(np.broadcast_arrays(*key), self.key)
+        if len(order) == 0:
+            return np.full(query.shape, -1)
+        position = np.searchsorted(sorted_keys, query, side="right") - 1
+        found = (position >= 0) & (sorted_keys[np.maximum(position, 0)] == query)
+        return np.where(found, order[np.maximum(position, 0)], -1)
+
+    def read_rows(self, rows, columns=None):
+        """
+        Gathers rows (e.g. from find) of the given columns (default: all), nan where rows is -1
+        """
+        rows = np.asarray(rows)
+        chunk_rows = self._schema["chunk_rows"]
+        result = {}
+        for name in columns or self.columns:
+            spec = self._schema["columns"][name]
+            values = np.full((*rows.shape, *spec["shape"]), np.nan, dtype=np.result_type(spec["dtype"], float))
+            chunks = self.chunks(name)
+            for chunk in np.unique(rows[rows >= 0] // chunk_rows):
+                selected = (rows >= 0) & (rows // chunk_rows == chunk)
+                values[selected] = chunks[chunk][rows[selected] - chunk * chunk_rows]
+            result[name] = values
+        return result
+
+    def lookup(self, *key, columns=None):
+        """
+        read_rows(find(*key), columns) and the mask of keys that were found
+        """
+        rows = self.find(*key)
+        return self.read_rows(rows, columns), rows >= 0
+
+    def _key_index(self):
+        if self._index is None:
+            keys = _key_records([self.column(name) for name in self.key], self.key)
+            order = np.argsort(keys, kind="stable")
+            self._index = keys[order], order
+        return self._index
+
+    def _open_chunk(self, name, chunk, mode):
+        path = self.path / name / f"{chunk:06d}.npy"
+        if mode == "r+" and not path.exists():
+            spec = self._schema["columns"][name]
+            path.parent.mkdir(exist_ok=True)
+            np.lib.format.open_memmap(path, mode="w+", dtype=spec["dtype"],
+                                      shape=(self._schema["chunk_rows"], *spec["shape"])).flush()
+        return np.load(path, mmap_mode=mode)
+
+    @contextmanager
+    def _write_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.path / "schema.json.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _write_schema(self):
+        # Written to a temporary file and renamed, so readers never see a partial schema
+        temporary = self.path / "schema.json.tmp"
+        temporary.write_text(json.dumps(self._schema, indent=2))
+        os.replace(temporary, self.path / "schema.json")
+
+
+def _column_spec(spec):
+    dtype, shape = spec if isinstance(spec, tuple) else (spec, ())
+    return {"dtype": np.dtype(dtype).str, "shape": list(shape)}
+
+
+def _key_records(values, names):
+    """
+    Key columns as one structured array, which sorts and compares lexicographically
+    """
+    records = np.empty(np.shape(values[0]), dtype=[(name, np.float64) for name in names])
+    for name, value in zip(names, values):
+        records[name] = np.round(value, KEY_DECIMALS)
+    return records
+
+
+def open_polar_store(path, mode="a"):
+    """
+    ResultStore of NACA polars: M, P, alpha (degrees) and the POLAR_COLUMNS loads
+    """
+    return ResultStore(path, {name: "float64" for name in POLAR_COLUMNS}, mode)
+
+
+def read_polar(store, M, P, alpha):
+    """
+    POLAR_COLUMNS of one NACA airfoil at every alpha (degrees), or None unless all are stored
+    """
+    values, found = store.lookup(M, P, alpha, columns=POLAR_COLUMNS)
+    return values if found.all() else None
+
+
+def fill_polar(store, M, P, alpha):
+    """
+    read_polar that computes and appends the missing angles first
+    """
+    alpha = np.asarray(alpha, dtype=float)
+    missing = store.find(M, P, alpha) < 0
+    if missing.any():
+        from calculateCL import compute_loads
+        loads = compute_loads(M, P, np.radians(alpha[missing]))
+        store.append({"M": M, "P": P, "alpha": alpha[missing], **{name: loads[name] for name in POLAR_COLUMNS}})
+    return read_polar(store, M, P, alpha)
@@ -3,12 +3,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 from io import BytesIO
+from pathlib import Path
 from camberline import camber_line
-from camberSlope import camber_slope_at_x
-from calculateCL import compute_Cl, compute_Cl_poly
-from vectorField import compute_velocity
-from vectorFieldUDF import compute_velocity_poly
-from Circulation import compute_circulation,compute_bound_circulation 
+from camberSlope import camber_slope_at_x, poly_slope_at_x
+from calculateCL import compute_Cl, compute_Cl_poly, compute_Cl_sweep, compute_Cl_poly_sweep
+from vectorField import compute_velocity, iter_velocity
+from vectorFieldUDF import compute_velocity_poly, iter_velocity_poly
+from Circulation import compute_circulation,compute_bound_circulation,compute_analytic_circulation 
+from streamlines import compute_streamlines, compute_streamlines_poly, inflow_seeds
+from instrumentation import instrument, reset_instrumentation, stage
+from resultStore import ResultStore, read_polar
+from jobQueue import JobQueue, report_progress
+import velocityGrid
 st.set_page_config(layout="wide")
 
 st.markdown(
@@ -99,6 +105,314 @@ st.markdown(
 )
 
 
+# ---------------------
+# CACHED COMPUTATIONS
+# Streamlit reruns this script on every widget change, so solver results and
+# rendered figures are cached on their (hashable) inputs and shared by all sessions.
+# A geometry is (M, P, None) for NACA airfoils and (None, None, coeffs) for polynomials.
+
+cached = st.cache_data(max_entries=64, ttl=60 * 60, show_spinner=False)
+
+# Precomputed NACA polars, e.g. from `python airfoilCli.py job.json --store polar_store`
+POLAR_STORE_DIR = Path("polar_store")
+
+# Velocity grids of the streamline overlay are written here, and reloaded after restarts,
+# when the directory exists (create it to turn persistence on)
+GRID_CACHE_DIR = Path("velocity_grids")
+if GRID_CACHE_DIR.is_dir():
+    velocityGrid.CACHE_DIR = GRID_CACHE_DIR
+
+
+def figure_png(fig):
+    """Render a figure to PNG bytes once and release it."""
+    buffer = BytesIO()
+    with stage("plotting"):
+        fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+@cached
+def camber_samples(M, P, coeffs):
+    """Camber line sampled at 200 chord positions."""
+    x = np.linspace(0, 1, 200)
+    y_c = camber_line(x, M, P) if coeffs is None else np.polyval(coeffs, x)
+    return x, y_c
+
+
+# ---------------------
+# BACKGROUND JOBS
+# Circulation and fine speed maps run on a shared worker pool. The page only submits
+# them and polls their status from a fragment, so it never waits on the solver, and
+# identical requests from any session share one job.
+
+JOB_POLL_SECONDS = 0.5
+SPEED_MAP_RESOLUTIONS = {"Off": None, "200 × 150": (200, 150), "800 × 600": (800, 600)}
+
+
+@st.cache_resource
+def job_queue():
+    return JobQueue()
+
+
+def submit_job(state_key, request, function, *args, message=None, context=(), retry=False):
+    """
+    Submit function(*args) as the job of state_key, unless request is already its job.
+    A cancelled request is only submitted again with retry (an explicit click), a replaced
+    job is cancelled for this session, context is passed on to the renderer.
+    """
+    current = st.session_state.get(state_key)
+    if current is not None and current["request"] == request and not (current["cancelled"] and retry):
+        return
+    if current is not None and not current["cancelled"]:
+        job_queue().cancel(current["id"])
+    job_id = job_queue().submit(function, *args, key=request, message=message)
+    st.session_state[state_key] = {"id": job_id, "request": request, "context": context, "cancelled": False}
+
+
+def show_job(state_key, label, render):
+    """
+    The job of state_key: a status box with progress and a cancel button while it runs,
+    then one holding the job's solver metrics, and render(result, *context). A fragment
+    polls the queue, the rest of the page stays interactive.
+    """
+    current = st.session_state.get(state_key)
+    if current is None:
+        return
+    if current["cancelled"]:
+        st.warning(f"{label} was cancelled.")
+        return
+    try:
+        running = job_queue().status(current["id"])["state"] in ("queued", "running")
+    except KeyError:  # Dropped from the queue's finished jobs
+        del st.session_state[state_key]
+        return
+
+    @st.fragment(run_every=JOB_POLL_SECONDS if running else None)
+    def job_panel():
+        job = job_queue().status(current["id"])
+        if job["state"] in ("queued", "running"):
+            with st.status(f"{label}: {job['message']}", state="running", expanded=True):
+                st.progress(job["progress"])
+                if st.button("Cancel", key=f"{state_key}_cancel"):
+                    # Other sessions waiting for the same job keep it running
+                    job_queue().cancel(current["id"])
+                    current["cancelled"] = True
+                    st.rerun()
+        elif running:
+            st.rerun()  # Finished since the page ran, draw the result without polling
+        elif job["state"] == "done":
+            with st.status(f"{label}: complete", state="complete", expanded=False):
+                st.caption("Solver metrics of the background job")
+                st.json(job["metrics"])
+            render(job["result"], *current["context"])
+        elif job["state"] == "failed":
+            st.status(f"{label}: failed", state="error", expanded=False)
+            st.error(f"{label} failed: {job['error']}")
+        else:
+            st.warning(f"{label} was cancelled.")
+    job_panel()
+
+
+def circulation_result(title, method):
+    """Renderer of a circulation job, compared with the closed form."""
+    def render(circulation, M, P, alpha):
+        st.success(f"**{title} at {alpha}°:** `{circulation:.4f}`")
+        analytic = compute_analytic_circulation(M, P, ((alpha*np.pi)/180))
+        st.caption(f"Thin airfoil theory Γ = πcU(A0 + A1/2): `{analytic:.4f}` "
+                   f"({method} differs by `{circulation - analytic:+.4f}`)")
+    return render
+
+
+def speed_map(M, P, coeffs, alpha_rad, nx, ny):
+    """Exact speed on an nx x ny grid over the vector field window, reporting progress per tile."""
+    x, y = np.meshgrid(np.linspace(-1.5, 2.5, nx), np.linspace(-1, 2, ny))
+    if coeffs is None:
+        tiles = iter_velocity(M, P, x, y, alpha_rad)
+    else:
+        tiles = iter_velocity_poly(coeffs, x, y, alpha_rad)
+    for _, stop, vel_x, vel_y in tiles:
+        report_progress(stop / x.size, f"{stop:,} of {x.size:,} points")
+    return np.hypot(vel_x, vel_y).reshape(x.shape)
+
+
+def speed_map_figure(speed):
+    fig, ax = plt.subplots(figsize=(9, 4))
+    # Speeds next to the vortex sheet are unbounded, so the colour scale stops at the 99th percentile
+    image = ax.imshow(speed, extent=(-1.5, 2.5, -1, 2), origin="lower", cmap="turbo",
+                      vmax=np.percentile(speed, 99), aspect="auto")
+    cb = plt.colorbar(image, ax=ax, shrink=0.8, aspect=20, pad=0.02)
+    cb.set_label("Speed", fontsize=12, weight='bold')
+    ax.set_xlabel("X-Coordinate")
+    ax.set_ylabel("Y-Coordinate")
+    ax.set_title(f"Speed Map ({speed.shape[1]} × {speed.shape[0]})")
+    return figure_png(fig)
+
+
+@cached
+def Cl_polar(M, P, coeffs):
+    """Cl over -10° to 15°, the zero-lift angle (°), the lift-curve slope and the CSV export."""
+    alpha_range = np.linspace(-10, 15, 100)
+
+    stored = read_polar(ResultStore(POLAR_STORE_DIR), M, P, alpha_range) \
+        if coeffs is None and (POLAR_STORE_DIR / "schema.json").exists() else None
+
+    if stored is not None:
+        Cl_values = stored["Cl"]
+        lift_slope, Cl_zero = np.polyfit(np.radians(alpha_range), Cl_values, 1)  # Cl is linear in alpha
+        alpha_zero_lift = -Cl_zero / lift_slope
+    elif coeffs is None:
+        Cl_values, alpha_zero_lift, lift_slope = compute_Cl_sweep(M, P, np.radians(alpha_range))
+    else:
+        Cl_values, alpha_zero_lift, lift_slope = compute_Cl_poly_sweep(coeffs, np.radians(alpha_range))
+
+    # Save data to CSV
+    df = pd.DataFrame({"Angle_of_Attack (α)": alpha_range, "Lift_Coefficient (Cl)": Cl_values})
+    csv_buffer = BytesIO()
+    df.to_csv(csv_buffer, index=False)
+    return alpha_range, Cl_values, np.degrees(alpha_zero_lift), lift_slope, csv_buffer.getvalue()
+
+
+@cached
+def velocity_field(M, P, coeffs, alpha_rad):
+    """Velocity on the 30x20 vector field grid."""
+    x_cdn, y_cdn = np.meshgrid(np.linspace(-1.5, 2.5, 30), np.linspace(-1, 2, 20))
+
+    if coeffs is None:
+        c, d = compute_velocity(M, P, x_cdn, y_cdn, alpha_rad)
+    else:
+        c, d = compute_velocity_poly(coeffs, x_cdn, y_cdn, alpha_rad)
+    return x_cdn, y_cdn, np.reshape(c, x_cdn.shape), np.reshape(d, x_cdn.shape)
+
+
+@cached
+def streamline_paths(M, P, coeffs, alpha_rad, n_seeds):
+    """Streamlines through n_seeds inflow points, as one polyline broken by nan."""
+    seeds_x, seeds_y = inflow_seeds(n_seeds)
+    if coeffs is None:
+        x, y, _ = compute_streamlines(M, P, seeds_x, seeds_y, alpha_rad, velocity="bilinear",
+                                      direction="forward")
+    else:
+        x, y, _ = compute_streamlines_poly(coeffs, seeds_x, seeds_y, alpha_rad, velocity="bilinear",
+                                           direction="forward")
+    # Every column ends in nan padding (or gets a nan row), so one plot call draws them all
+    gap = np.full((1, n_seeds), np.nan)
+    return np.vstack((x, gap)).ravel(order="F"), np.vstack((y, gap)).ravel(order="F")
+
+
+@cached
+def airfoil_figure(M, P, T, coeffs):
+    fig, ax = plt.subplots(figsize=(8, 3))
+    x, y_c = camber_samples(M, P, coeffs)
+
+    # Plot camber line
+    ax.plot(x, y_c, label="Camber Line", color='#0078FF', linewidth=1)
+
+    # Compute airfoil thickness
+    def thickness_distribution(x, t=0.10):
+        return 5 * t * (0.2969 * np.sqrt(x) - 0.126 * x - 0.3516 * x**2 + 0.2843 * x**3 - 0.1015 * x**4)
+
+    y_t = thickness_distribution(x, T if coeffs is None else 0.12)
+    y_upper, y_lower = y_c + y_t, y_c - y_t
+
+    # Plot upper & lower surfaces
+    ax.plot(x, y_upper, color='black', linewidth=1, label="Airfoil Upper Surface")
+    ax.plot(x, y_lower, color='black', linewidth=1, label="Airfoil Lower Surface")
+
+    # Formatting
+    ax.set_xlabel("Chord Position", fontsize=14, fontweight='bold')
+    ax.set_ylabel("Vertical Position", fontsize=14, fontweight='bold')
+    ax.set_title("Airfoil & Camber Line", fontsize=16, color='#0078FF')
+    ax.legend(fontsize=12)
+    ax.set_xlim(0, 1)
+    ax.grid(True, linestyle="--", alpha=0.6)
+    ax.set_aspect('equal', adjustable='datalim')
+    return figure_png(fig)
+
+
+@cached
+def slope_figure(M, P, coeffs):
+    x, _ = camber_samples(M, P, coeffs)
+
+    # Compute slope distribution
+    slopes = camber_slope_at_x(M, P, x) if coeffs is None else poly_slope_at_x(coeffs, x)
+
+    # Create slope plot
+    fig_slope, ax_slope = plt.subplots(figsize=(8, 3))
+    ax_slope.plot(x, slopes, color='r', linewidth=1.5, label="Camber Slope (dy/dx)")
+
+    # Highlight maximum slope
+    max_idx = np.argmax(np.abs(slopes))
+    ax_slope.scatter(x[max_idx], slopes[max_idx], color='black', zorder=3, label="Max Slope")
+
+    # Formatting
+    ax_slope.set_xlabel("Chord Position (x)", fontsize=12, fontweight='bold')
+    ax_slope.set_ylabel("Camber Slope (dy/dx)", fontsize=12, fontweight='bold')
+    ax_slope.set_title("Slope Distribution Along Chord", fontsize=14, color='r')
+    ax_slope.axhline(0, color="gray", linestyle="--", linewidth=1)
+    ax_slope.legend(fontsize=10)
+    ax_slope.grid(True, linestyle="--", alpha=0.5)
+    ax_slope.set_xlim(0, 1)
+    return figure_png(fig_slope)
+
+
+@cached
+def Cl_figure(M, P, coeffs):
+    alpha_range, Cl_values, alpha_zero_lift, _, _ = Cl_polar(M, P, coeffs)
+
+    # Create Cl vs Alpha plot
+    fig_Cl, ax_Cl = plt.subplots(figsize=(8, 3))
+    ax_Cl.plot(alpha_range, Cl_values, color='g', linewidth=1.5, label="Lift Coefficient (Cl)")
+
+    # Highlight zero-lift angle (closed form, not a sampled minimum)
+    ax_Cl.axvline(alpha_zero_lift, color='r', linestyle='--', linewidth=1, alpha=0.7, label=f"Zero-Lift Angle ({alpha_zero_lift:.2f}°)")
+    ax_Cl.scatter(alpha_zero_lift, 0, color='black', zorder=3)
+
+    # Formatting
+    ax_Cl.set_xlabel("Angle of Attack (α)", fontsize=12, fontweight='bold')
+    ax_Cl.set_ylabel("Lift Coefficient (Cl)", fontsize=12, fontweight='bold')
+    ax_Cl.set_title("Lift Coefficient vs Angle of Attack", fontsize=14, color='g')
+    ax_Cl.axhline(0, color="gray", linestyle="--", linewidth=1)
+    ax_Cl.legend(fontsize=10)
+    ax_Cl.grid(True, linestyle="--", alpha=0.5)
+    return figure_png(fig_Cl)
+
+
+@cached
+def vector_field_figure(M, P, coeffs, alpha_rad, n_streamlines=0):
+    fig, ax = plt.subplots(figsize=(9, 4))
+    x_cdn, y_cdn, c, d = velocity_field(M, P, coeffs, alpha_rad)
+
+    if n_streamlines:
+        ax.plot(*streamline_paths(M, P, coeffs, alpha_rad, n_streamlines), color="gray", linewidth=0.5, alpha=0.7)
+
+    magnitude = np.sqrt(c**2 + d**2)
+
+    q = ax.quiver(x_cdn, y_cdn, c, d, magnitude, cmap='turbo', scale=900, width=0.003, edgecolors='k', alpha=0.8)
+    cb = plt.colorbar(q, ax=ax, shrink=0.8, aspect=20, pad=0.02)
+    cb.set_label("Vector Magnitude", fontsize=12, weight='bold')
+
+    # Plot camber line
+    x_coords = np.linspace(0, 1, 1000)
+    y_coords = np.polyval(coeffs, x_coords) if coeffs is not None else camber_line(x_coords, M, P)
+    ax.plot(x_coords, y_coords, color="black", linewidth=1.5)
+
+    ax.set_xlabel("X-Coordinate")
+    ax.set_ylabel("Y-Coordinate")
+    ax.set_title("Velocity Vector Field Around Airfoil")
+    ax.set_xlim(-1.5, 2.5)
+    ax.set_ylim(-1, 2)
+    ax.grid(True, linestyle="--", alpha=0.5)
+    return figure_png(fig)
+
+
+# Solver metrics of this run, shown in the debug expander at the bottom. A rerun raised by
+# a widget or a job panel skips __exit__ below, so blocks left over from earlier runs of
+# this script thread are dropped first
+reset_instrumentation()
+metrics_scope = instrument()
+metrics = metrics_scope.__enter__()
+
 st.title("NACA & Custom Camber Line Plotter")
 
 option = st.selectbox(
@@ -116,8 +430,7 @@ with col1:
         P = st.number_input("Enter Position of Maximum Camber (P) [0-1]", min_value=0.0, max_value=1.0, value=0.4, step=0.001, format="%.3f")
         T = st.number_input("Enter Maximum Thickness (T) [0-1]", min_value=0.0, max_value=1.0, value=0.12, step=0.001, format="%.3f")
 
-        x = np.linspace(0, 1, 200)
-        y_c = camber_line(x, M, P)
+        geometry = (M, P, None)
     
 
     else:  # User-defined polynomial camber function
@@ -127,11 +440,11 @@ with col1:
         )
 
         try:
-            coeffs = [float(c.strip()) for c in coeffs_input.split(",")]
-            x = np.linspace(0, 1, 200)
-            y_c = np.polyval(coeffs, x)  # Use polynomial coefficients for camber line
+            coeffs = tuple(float(c.strip()) for c in coeffs_input.split(","))
+            geometry = (None, None, coeffs)
         except ValueError:
             st.error("❌ Invalid coefficients! Please enter numeric values separated by commas.")
+            metrics_scope.__exit__(None, None, None)
             st.stop()
 
     # 🔹 **Ensure slider and number input sync**
@@ -169,8 +482,7 @@ with col1:
         if option == "NACA 4-Digit":
             slope = camber_slope_at_x(M, P, x_value)
         else:
-            deriv = np.polyder(coeffs)  # Compute derivative directly from coefficients
-            slope = np.polyval(deriv, x_value)
+            slope = poly_slope_at_x(coeffs, x_value)  # Derivative straight from the coefficients
         st.success(f"**Slope at x = {x_value:.6f}:** `{slope:.6f}`")
 
     # 🔹 Compute Lift Coefficient (Cl)
@@ -197,16 +509,11 @@ with col1:
         alpha1 = st.number_input("Enter Angle of Attack (°)", value=2.0, step=0.1, format="%.2f", key="alpha_input")
 
         if st.button("Compute Circulation", key="compute_circulation_btn"):
-            # Show an initial status message
-            status = st.status("Computing circulation...", expanded=True)
+            alpha1_rad = (alpha1*np.pi)/180
+            submit_job("circulation_job", ("circulation", M, P, alpha1_rad), compute_circulation, M, P, alpha1_rad,
+                       message="Computing circulation...", context=(M, P, alpha1), retry=True)
 
-            # Compute circulation
-            circulation = compute_circulation(M, P, ((alpha1*np.pi)/180))
-
-            # Update the status message
-            status.update(label="Computation complete!", state="complete", expanded=False)
-
-            st.success(f"**Circulation at {alpha1}°:** `{circulation:.4f}`")
+        show_job("circulation_job", "Circulation", circulation_result("Circulation", "line integral"))
 
 
     if option == "NACA 4-Digit":
@@ -221,16 +528,12 @@ with col1:
         )
 
         if st.button("Compute Circulation", key="compute_bound_circulation_btn"):
-            # Show an initial status message
-            status = st.status("Computing circulation...", expanded=True)
-            
-            # Compute circulation
-            circulation = compute_bound_circulation(M, P, ((alpha2*np.pi)/180))
+            alpha2_rad = (alpha2*np.pi)/180
+            submit_job("bound_circulation_job", ("bound_circulation", M, P, alpha2_rad), compute_bound_circulation,
+                       M, P, alpha2_rad, message="Computing circulation...", context=(M, P, alpha2), retry=True)
 
-            # Update the status message
-            status.update(label="Computation complete!", state="complete", expanded=False)
-            
-            st.success(f"**Bound Circulation at {alpha2}°:** `{circulation:.4f}`")
+        show_job("bound_circulation_job", "Bound circulation",
+                 circulation_result("Bound Circulation", "bound circulation"))
 
 
 with col2:
@@ -244,79 +547,15 @@ with col2:
 
     if option_selected == "Airfoil & Camber Line":
         st.subheader("Airfoil & Camber Line Visualization")
-        fig, ax = plt.subplots(figsize=(8, 3))
-
-        # Plot camber line
-        ax.plot(x, y_c, label="Camber Line", color='#0078FF', linewidth=1)
-
-        # Compute airfoil thickness
-        def thickness_distribution(x, t=0.10):
-            return 5 * t * (0.2969 * np.sqrt(x) - 0.126 * x - 0.3516 * x**2 + 0.2843 * x**3 - 0.1015 * x**4)
-
-        if option == "NACA 4-Digit":
-            y_t = thickness_distribution(x, T)   
-        else:
-            y_t = thickness_distribution(x, 0.12)    
-        y_upper, y_lower = y_c + y_t, y_c - y_t
-
-        # Plot upper & lower surfaces
-        ax.plot(x, y_upper, color='black', linewidth=1, label="Airfoil Upper Surface")
-        ax.plot(x, y_lower, color='black', linewidth=1, label="Airfoil Lower Surface")
-
-        # Formatting
-        ax.set_xlabel("Chord Position", fontsize=14, fontweight='bold')
-        ax.set_ylabel("Vertical Position", fontsize=14, fontweight='bold')
-        ax.set_title("Airfoil & Camber Line", fontsize=16, color='#0078FF')
-        ax.legend(fontsize=12)
-        ax.set_xlim(0, 1)
-        ax.grid(True, linestyle="--", alpha=0.6)
-        ax.set_aspect('equal', adjustable='datalim')
-
-        st.pyplot(fig)
+        st.image(airfoil_figure(*geometry[:2], T if option == "NACA 4-Digit" else None, geometry[2]))
 
     elif option_selected == "Slope vs Chord Position":
         st.subheader("Slope of Camber Line vs. Chord Position")
-
-        # Compute slope distribution
-        if option == "NACA 4-Digit":
-            slopes = np.array([camber_slope_at_x(M, P, xi) for xi in x])
-        else:
-            deriv = np.polyder(coeffs)
-            slopes = np.polyval(deriv, x)
-
-        # Create slope plot
-        fig_slope, ax_slope = plt.subplots(figsize=(8, 3))
-        ax_slope.plot(x, slopes, color='r', linewidth=1.5, label="Camber Slope (dy/dx)")
-
-        # Highlight maximum slope
-        max_idx = np.argmax(np.abs(slopes))
-        ax_slope.scatter(x[max_idx], slopes[max_idx], color='black', zorder=3, label="Max Slope")
-
-        # Formatting
-        ax_slope.set_xlabel("Chord Position (x)", fontsize=12, fontweight='bold')
-        ax_slope.set_ylabel("Camber Slope (dy/dx)", fontsize=12, fontweight='bold')
-        ax_slope.set_title("Slope Distribution Along Chord", fontsize=14, color='r')
-        ax_slope.axhline(0, color="gray", linestyle="--", linewidth=1)
-        ax_slope.legend(fontsize=10)
-        ax_slope.grid(True, linestyle="--", alpha=0.5)
-        ax_slope.set_xlim(0, 1)
-
-        st.pyplot(fig_slope)
+        st.image(slope_figure(*geometry))
 
     elif option_selected == "Lift Coefficient vs Angle of Attack":
         st.subheader("Lift Coefficient (Cl) vs Angle of Attack (α)")
-        alpha_range = np.linspace(-10, 15, 100)
-
-        if option == "NACA 4-Digit":
-            Cl_values = np.array([compute_Cl(M, P, (a*np.pi)/180) for a in alpha_range])
-        else:
-            Cl_values = np.array([compute_Cl_poly(coeffs, (a*np.pi)/180) for a in alpha_range])
-
-        # Save data to CSV
-        df = pd.DataFrame({"Angle_of_Attack (α)": alpha_range, "Lift_Coefficient (Cl)": Cl_values})
-        csv_buffer = BytesIO()
-        df.to_csv(csv_buffer, index=False)
-        csv_data = csv_buffer.getvalue()
+        _, _, _, lift_slope, csv_data = Cl_polar(*geometry)
 
         # Download button
         st.download_button(
@@ -326,60 +565,34 @@ with col2:
             mime="text/csv"
         )
 
-        # Create Cl vs Alpha plot
-        fig_Cl, ax_Cl = plt.subplots(figsize=(8, 3))
-        ax_Cl.plot(alpha_range, Cl_values, color='g', linewidth=1.5, label="Lift Coefficient (Cl)")
-
-        # Highlight zero-lift angle
-        zero_lift_idx = np.argmin(np.abs(Cl_values))
-        ax_Cl.axvline(alpha_range[zero_lift_idx], color='r', linestyle='--', linewidth=1, alpha=0.7, label="Zero-Lift Angle")
-        ax_Cl.scatter(alpha_range[zero_lift_idx], Cl_values[zero_lift_idx], color='black', zorder=3)
-
-        # Formatting
-        ax_Cl.set_xlabel("Angle of Attack (α)", fontsize=12, fontweight='bold')
-        ax_Cl.set_ylabel("Lift Coefficient (Cl)", fontsize=12, fontweight='bold')
-        ax_Cl.set_title("Lift Coefficient vs Angle of Attack", fontsize=14, color='g')
-        ax_Cl.axhline(0, color="gray", linestyle="--", linewidth=1)
-        ax_Cl.legend(fontsize=10)
-        ax_Cl.grid(True, linestyle="--", alpha=0.5)
-
-        st.pyplot(fig_Cl)
+        st.image(Cl_figure(*geometry))
+        st.caption(f"Lift-curve slope: `{lift_slope:.4f}` per radian (`{np.radians(lift_slope):.4f}` per degree)")
 
     elif option_selected == "Vector Field Plot":
         st.subheader("Vector Field Plot")
 
-        alpha = st.number_input("Angle of Attack (α in degrees)", min_value=-10.0, max_value=15.0, value=0.01)
-        alpha_rad = np.radians(alpha)
-
-        fig, ax = plt.subplots(figsize=(9, 4))
-        x_cdn, y_cdn = np.meshgrid(np.linspace(-1.5, 2.5, 30), np.linspace(-1, 2, 20))
+        # Streamlines reuse the geometry's cached basis fields, so scrubbing alpha never redoes Biot-Savart
+        alpha = st.slider("Angle of Attack (α in degrees)", min_value=-10.0, max_value=15.0, value=0.0, step=0.1)
+        alpha_rad = float(np.radians(alpha))
 
-        if option == "NACA 4-Digit":
-            slopes = np.array([camber_slope_at_x(M, P, xi) for xi in x])
-            c, d = compute_velocity(M, P, x_cdn, y_cdn, alpha_rad)
-        else:
-            c, d = compute_velocity_poly(coeffs, x_cdn, y_cdn, alpha_rad)
-
-        magnitude = np.sqrt(c**2 + d**2)
-
-        q = ax.quiver(x_cdn, y_cdn, c, d, magnitude, cmap='turbo', scale=900, width=0.003, edgecolors='k', alpha=0.8)
-        cb = plt.colorbar(q, ax=ax, shrink=0.8, aspect=20, pad=0.02)
-        cb.set_label("Vector Magnitude", fontsize=12, weight='bold')
-
-        # Plot camber line
-        x_coords = np.linspace(0, 1, 1000)
-        y_coords = np.polyval(coeffs, x_coords) if option != "NACA 4-Digit" else [camber_line(i, M, P) for i in x_coords]
-        ax.plot(x_coords, y_coords, color="black", linewidth=1.5)
+        n_streamlines = st.slider("Streamlines", min_value=0, max_value=200, value=0, step=10,
+                                  help="Seeded along the left edge, traced through the cached velocity grid")
 
-        ax.set_xlabel("X-Coordinate")
-        ax.set_ylabel("Y-Coordinate")
-        ax.set_title("Velocity Vector Field Around Airfoil")
-        ax.set_xlim(-1.5, 2.5)
-        ax.set_ylim(-1, 2)
-        ax.grid(True, linestyle="--", alpha=0.5)
+        st.image(vector_field_figure(*geometry, alpha_rad, n_streamlines))
 
-        st.pyplot(fig)
-
-
-
-             
+        resolution = st.selectbox("Speed Map", list(SPEED_MAP_RESOLUTIONS),
+                                  help="Exact speed on a fine grid, computed in the background")
+        if SPEED_MAP_RESOLUTIONS[resolution] is None:
+            current = st.session_state.pop("speed_map_job", None)
+            if current is not None and not current["cancelled"]:
+                job_queue().cancel(current["id"])
+        else:
+            request = ("speed_map", *geometry, alpha_rad, *SPEED_MAP_RESOLUTIONS[resolution])
+            submit_job("speed_map_job", request, speed_map, *request[1:], message="Computing speed map...")
+            show_job("speed_map_job", "Speed map", lambda speed: st.image(speed_map_figure(speed)))
+
+metrics_scope.__exit__(None, None, None)
+with st.expander("Debug: solver metrics"):
+    st.caption("Work done in this run. Results served from the app cache do not show up here, "
+               "background jobs show theirs in their status box.")
+    st.json(metrics)
@@ -0,0 +1,221 @@
+import numpy as np
+from airfoilSolution import DEFAULT_CONFIG, get_solution, get_solution_poly
+from instrumentation import count, timed
+from velocityGrid import FIELD_BOUNDS, INTERPOLATIONS, velocity_grid
+
+STEP = 0.01  # Arc length per step (chord lengths), about one vortex panel
+MAX_STEPS = 1000
+TOLERANCE = 1e-5  # Position error per RK45 step
+MIN_SPEED = 1e-9  # Particles slower than this sit at a stagnation point and stop
+PATH_ROWS = 128  # Initial rows of the path arrays, doubled as streamlines grow
+
+# Dormand-Prince 5(4) tableau
+_DP_NODES = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_DP_ERROR = np.array([71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40])
+
+
+def compute_streamlines(M, P, seeds_x, seeds_y, alpha, bounds=FIELD_BOUNDS, velocity="exact", **options):
+    """
+    Traces streamlines of the flow around a NACA 4-digit airfoil from a batch of seed points.
+
+    Parameters:
+    M : float -> Maximum camber
+    P : float -> Position of maximum camber
+    seeds_x, seeds_y : array-like -> Seed points
+    alpha : float -> Angle of attack (in radians)
+    bounds : tuple -> (x_min, x_max, y_min, y_max), particles leaving it stop
+    velocity : str -> "exact" (Biot-Savart every step), or "bilinear" or "bicubic" interpolation
+                      of the cached velocity grid over bounds (see velocityGrid), much faster
+                      but less accurate close to the vortex sheet
+    options -> config (SolverConfig) and the keyword arguments of trace_streamlines
+
+    Returns:
+    x_paths, y_paths, n_points -> See trace_streamlines
+    """
+    config = options.pop("config", DEFAULT_CONFIG)
+    field = _velocity(get_solution(M, P, config=config), alpha, bounds, velocity)
+    return trace_streamlines(field, seeds_x, seeds_y, bounds, **options)
+
+
+def compute_streamlines_poly(coeffs, seeds_x, seeds_y, alpha, bounds=FIELD_BOUNDS, velocity="exact", **options):
+    """
+    compute_streamlines for a polynomial camber line [a_n, ..., a_1, a_0]
+    """
+    config = options.pop("config", DEFAULT_CONFIG)
+    field = _velocity(get_solution_poly(coeffs, config), alpha, bounds, velocity)
+    return trace_streamlines(field, seeds_x, seeds_y, bounds, **options)
+
+
+def inflow_seeds(n, bounds=FIELD_BOUNDS):
+    """
+    n seed points spread over the upstream edge of bounds
+    """
+    x_min, _, y_min, y_max = bounds
+    y = np.linspace(y_min, y_max, n + 2)[1:-1]
+    return np.full(n, x_min), y
+
+
+def _velocity(solution, alpha, bounds, velocity):
+    if velocity == "exact":
+        return lambda x, y: solution.velocity(x, y, alpha)
+    if velocity in INTERPOLATIONS:
+        return velocity_grid(solution, bounds).at(alpha, velocity)
+    raise ValueError(f"Unknown velocity: {velocity}, choose from {('exact',) + INTERPOLATIONS}")
+
+
+@timed("streamlines")
+def trace_streamlines(velocity, seeds_x, seeds_y, bounds=FIELD_BOUNDS, step=STEP, max_steps=MAX_STEPS,
+                      method="rk4", direction="both", tol=TOLERANCE):
+    """
+    Advances all seed particles at once along the direction of the velocity field, so
+    every integration stage is one batched velocity evaluation over the particles still
+    moving. Streamlines are parametrised by arc length (the step is a distance, not a
+    time), particles stop when they leave bounds, reach a stagnation point or run out
+    of steps, and stopped particles are dropped from later evaluations.
+
+    Parameters:
+    velocity : callable -> (x, y) -> (vel_x, vel_y) for flat arrays of points
+    seeds_x, seeds_y : array-like -> Seed points
+    bounds : tuple -> (x_min, x_max, y_min, y_max)
+    step : float -> Arc length per step, the initial and largest step for "rk45"
+    max_steps : int -> Steps per direction
+    method : str -> "rk4" (fixed step) or "rk45" (adaptive Dormand-Prince, per particle step sizes)
+    direction : str -> "forward", "backward" or "both" (the seed lies inside the streamline)
+    tol : float -> Position error per step for "rk45"
+
+    Returns:
+    x_paths, y_paths : numpy array -> Points of shape (n_steps, n_seeds), one streamline per
+                                      column, padded with nan after its last point
+    n_points : numpy array -> Points per streamline
+    """
+    if method not in ("rk4", "rk45"):
+        raise ValueError(f"Unknown method: {method}, choose from ('rk4', 'rk45')")
+    if direction not in ("forward", "backward", "both"):
+        raise ValueError(f"Unknown direction: {direction}, choose from ('forward', 'backward', 'both')")
+    seeds = np.stack(np.broadcast_arrays(np.ravel(seeds_x), np.ravel(seeds_y))).astype(float)
+    advance = _trace_rk4 if method == "rk4" else _trace_rk45
+
+    if direction == "forward":
+        return advance(velocity, seeds, bounds, step, max_steps, tol)
+    backward = advance(lambda x, y: tuple(-v for v in velocity(x, y)), seeds, bounds, step, max_steps, tol)
+    if direction == "backward":
+        return backward
+    forward = advance(velocity, seeds, bounds, step, max_steps, tol)
+
+    # Row r of a joined streamline is backward point n_back - 1 - r, then forward point r - n_back + 1
+    # (skipping the repeated seed), rows past its end read a nan row appended after the forward part
+    n_back, n_rows = backward[2], len(backward[0])
+    n_points = n_back + forward[2] - 1
+    row = np.arange(n_points.max())[:, None]
+    nan_row = np.full((1, len(n_points)), np.nan)
+    joined = [np.concatenate((b, f, nan_row)) for b, f in zip(backward[:2], forward[:2])]
+    index = np.where(row < n_back, n_back - 1 - row, np.minimum(n_rows + row - n_back + 1, n_rows + len(forward[0])))
+    index[row >= n_points] = n_rows + len(forward[0])
+    x_paths, y_paths = (np.take_along_axis(path, index, axis=0) for path in joined)
+    return x_paths, y_paths, n_points
+
+
+def _direction(velocity, x, y):
+    """
+    Unit tangent of the streamlines at (x, y), and whether the flow is moving there
+    """
+    vel_x, vel_y = velocity(x, y)
+    speed = np.hypot(vel_x, vel_y)
+    moving = speed > MIN_SPEED
+    speed = np.where(moving, speed, 1)
+    return np.stack((vel_x / speed, vel_y / speed)), moving
+
+
+def _inside(points, bounds):
+    x, y = points
+    return (x >= bounds[0]) & (x <= bounds[1]) & (y >= bounds[2]) & (y <= bounds[3])
+
+
+def _new_paths(seeds, max_steps):
+    paths = np.full((2, min(max_steps + 1, PATH_ROWS), seeds.shape[1]), np.nan)
+    paths[:, 0] = seeds
+    return paths, np.ones(seeds.shape[1], dtype=np.intp)
+
+
+def _record(paths, n_points, columns, points, max_steps):
+    """
+    Appends points to the streamlines in columns, doubling the rows of paths when full
+    """
+    rows = n_points[columns]
+    if rows.size and rows.max() >= paths.shape[1]:
+        grown = np.full((2, min(2 * paths.shape[1], max_steps + 1), paths.shape[2]), np.nan)
+        grown[:, :paths.shape[1]] = paths
+        paths = grown
+    paths[:, rows, columns] = points
+    n_points[columns] += 1
+    return paths
+
+
+def _finish(paths, n_points):
+    paths = paths[:, :n_points.max()]
+    return paths[0], paths[1], n_points
+
+
+def _trace_rk4(velocity, seeds, bounds, step, max_steps, tol):
+    paths, n_points = _new_paths(seeds, max_steps)
+    active = np.flatnonzero(_inside(seeds, bounds))
+    points = seeds[:, active]
+
+    for _ in range(max_steps):
+        if active.size == 0:
+            break
+        count("streamline_steps", active.size)
+        k1, moving = _direction(velocity, *points)
+        k2, _ = _direction(velocity, *(points + step / 2 * k1))
+        k3, _ = _direction(velocity, *(points + step / 2 * k2))
+        k4, _ = _direction(velocity, *(points + step * k3))
+        points = points + step / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+        keep = moving & _inside(points, bounds)
+        paths = _record(paths, n_points, active[keep], points[:, keep], max_steps)
+        active, points = active[keep], points[:, keep]
+    return _finish(paths, n_points)
+
+
+def _trace_rk45(velocity, seeds, bounds, step, max_steps, tol):
+    paths, n_points = _new_paths(seeds, max_steps)
+    active = np.flatnonzero(_inside(seeds, bounds))
+    points = seeds[:, active]
+    h = np.full(active.size, step)
+    min_step = step / 1024
+
+    # Rejected steps do not add points, so the loop is capped at a few tries per step
+    for _ in range(4 * max_steps):
+        if active.size == 0:
+            break
+        count("streamline_steps", active.size)
+        k = []
+        for weights in _DP_NODES:
+            stage_points = points + h * sum(w * k_i for w, k_i in zip(weights, k) if w)
+            direction, moving = _direction(velocity, *stage_points)
+            if not k:
+                moving_at_start = moving
+            k.append(direction)
+        new_points = stage_points  # The last stage is evaluated at the 5th order solution
+        error = h * np.max(np.abs(np.tensordot(_DP_ERROR, np.stack(k), axes=1)), axis=0)
+
+        accepted = (error <= tol) | (h <= min_step)
+        points = np.where(accepted, new_points, points)
+        scale = 0.9 * (tol / np.maximum(error, 1e-300)) ** 0.2
+        h = np.clip(h * np.clip(scale, 0.2, 5), min_step, step)
+
+        done = accepted & (~moving_at_start | ~_inside(points, bounds))
+        record = accepted & ~done
+        paths = _record(paths, n_points, active[record], points[:, record], max_steps)
+
+        keep = ~done & (n_points[active] <= max_steps)
+        active, points, h = active[keep], points[:, keep], h[keep]
+    return _finish(paths, n_points)
@@ -0,0 +1,151 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from calculateCL import compute_naca_batch
+from airfoilSolution import get_solution, get_solution_poly
+
+NACA_OUTPUTS = ("Cl", "Cm_c4", "A0", "A1", "A2", "circulation", "bound_circulation")
+POLY_OUTPUTS = ("Cl", "circulation", "bound_circulation")
+
+
+def run_naca_sweep(M, P, alpha, outputs=("Cl",), workers=None, chunk_size=65536, method="trapezoid"):
+    """
+    Evaluates a large table of NACA 4-digit airfoils across a process pool.
+
+    M, P and alpha are broadcast and flattened into one row per airfoil. The rows are
+    split into chunks of chunk_size, every worker writes its chunk straight into a
+    shared-memory result array, and the output order always matches the input order.
+
+    Parameters:
+    M, P, alpha : array-like -> Maximum camber, its position and angle of attack (radians)
+    outputs : tuple -> Any of NACA_OUTPUTS
+    workers : int -> Number of processes (default: all cores, 1 runs in this process)
+    chunk_size : int -> Rows per work unit
+    method : str -> "trapezoid" or "analytic" fourier coefficients
+
+    Returns:
+    results : dict -> Flat array per requested output, in row order
+    """
+    _check_outputs(outputs, NACA_OUTPUTS)
+    table = np.stack([np.ravel(a) for a in np.broadcast_arrays(M, P, alpha)]).astype(float)
+    return _run(_naca_chunk, {"table": table}, outputs, workers, chunk_size, method)
+
+
+def run_poly_sweep(coeff_sets, alpha, outputs=("Cl",), workers=None, chunk_size=1024):
+    """
+    Evaluates every polynomial camber line in coeff_sets at every angle in alpha
+    across a process pool, row order is (coefficient set, alpha).
+
+    Parameters:
+    coeff_sets : list -> Polynomial coefficient lists [a_n, ..., a_1, a_0] (highest order first)
+    alpha : array-like -> Angles of attack (radians)
+    outputs : tuple -> Any of POLY_OUTPUTS
+    workers : int -> Number of processes (default: all cores, 1 runs in this process)
+    chunk_size : int -> Rows per work unit
+
+    Returns:
+    results : dict -> Flat array per requested output, in row order
+    """
+    _check_outputs(outputs, POLY_OUTPUTS)
+    # Pad with leading zeros so every set has the same degree, the polynomials are unchanged
+    degree = max(len(c) for c in coeff_sets)
+    coeffs = np.zeros((len(coeff_sets), degree))
+    for i, c in enumerate(coeff_sets):
+        coeffs[i, degree - len(c):] = c
+
+    alpha = np.ravel(alpha)
+    index, alphas = np.meshgrid(np.arange(len(coeff_sets)), alpha, indexing="ij")
+    table = np.stack((index.ravel(), alphas.ravel())).astype(float)
+    return _run(_poly_chunk, {"table": table, "coeffs": coeffs}, outputs, workers, chunk_size, None)
+
+
+def _check_outputs(outputs, allowed):
+    unknown = set(outputs) - set(allowed)
+    if unknown:
+        raise ValueError(f"Unknown outputs: {sorted(unknown)}, choose from {allowed}")
+
+
+def _run(chunk_function, inputs, outputs, workers, chunk_size, method):
+    """
+    Copies the inputs into shared memory, runs chunk_function over row ranges and
+    collects the shared result array
+    """
+    n_rows = inputs["table"].shape[1]
+    workers = workers or os.cpu_count()
+    arrays = dict(inputs, results=np.empty((len(outputs), n_rows)))
+    blocks = {key: shared_memory.SharedMemory(create=True, size=max(a.nbytes, 1)) for key, a in arrays.items()}
+    views = {}
+
+    try:
+        for key, array in arrays.items():
+            views[key] = np.ndarray(array.shape, array.dtype, buffer=blocks[key].buf)
+            views[key][...] = array
+        specs = {key: (blocks[key].name, array.shape) for key, array in arrays.items()}
+        chunks = [(start, min(start + chunk_size, n_rows)) for start in range(0, n_rows, chunk_size)]
+
+        if workers == 1 or len(chunks) <= 1:
+            for start, stop in chunks:
+                chunk_function(views, tuple(outputs), method, start, stop)
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                futures = [pool.submit(_pool_task, chunk_function, specs, tuple(outputs), method, start, stop)
+                           for start, stop in chunks]
+                for future in futures:
+                    future.result()  # Re-raise any worker error
+
+        results = views["results"].copy()
+    finally:
+        views.clear()
+        for block in blocks.values():
+            try:
+                block.close()
+            except BufferError:  # A failed chunk can still hold a view, the mapping goes with it
+                pass
+            block.unlink()
+
+    return dict(zip(outputs, results))
+
+
+_worker_blocks = {}  # Shared blocks attached by this worker process, kept for its lifetime
+
+
+def _attach(name, shape):
+    """
+    Attach to a shared array created by _run without letting this process own it
+    """
+    if name not in _worker_blocks:
+        try:
+            block = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # Python < 3.13, pool workers share the parent's resource tracker
+            block = shared_memory.SharedMemory(name=name)
+        _worker_blocks[name] = block
+    return np.ndarray(shape, buffer=_worker_blocks[name].buf)
+
+
+def _pool_task(chunk_function, specs, outputs, method, start, stop):
+    arrays = {key: _attach(name, shape) for key, (name, shape) in specs.items()}
+    chunk_function(arrays, outputs, method, start, stop)
+
+
+def _naca_chunk(arrays, outputs, method, start, stop):
+    table, results = arrays["table"], arrays["results"]
+    batch = None
+    for row, name in enumerate(outputs):
+        if name in ("circulation", "bound_circulation"):
+            # Solutions are cached per process, so repeated geometries are only solved once
+            for i in range(start, stop):
+                solution = get_solution(table[0, i], table[1, i], method)
+                results[row, i] = getattr(solution, name)(table[2, i])
+        else:
+            if batch is None:
+                batch = compute_naca_batch(*table[:, start:stop], method)
+            results[row, start:stop] = batch[name]
+
+
+def _poly_chunk(arrays, outputs, method, start, stop):
+    table, coeffs, results = arrays["table"], arrays["coeffs"], arrays["results"]
+    for i in range(start, stop):
+        solution = get_solution_poly(coeffs[int(table[0, i])])
+        for row, name in enumerate(outputs):
+            results[row, i] = getattr(solution, name)(table[1, i])
@@ -0,0 +1,34 @@
+import numpy as np
+
+from airfoilSolution import SolverConfig
+from Circulation import compute_analytic_circulation, compute_circulation, verify_circulation, verify_circulation_poly
+
+# Cosine panels, where the line integral has converged (see converged_solution)
+CONVERGED = SolverConfig(200, "cosine")
+ALPHAS = np.array([-0.05, 0.0, 0.05, 0.1])
+
+
+def test_analytic_matches_line_integral():
+    analytic = compute_analytic_circulation(0.02, 0.4, ALPHAS, CONVERGED)
+    line_integral = [compute_circulation(0.02, 0.4, alpha, CONVERGED) for alpha in ALPHAS]
+    np.testing.assert_allclose(line_integral, analytic, rtol=1e-4)
+
+
+def test_verify_accepts_arrays():
+    report = verify_circulation(0.02, 0.4, ALPHAS, CONVERGED)
+    for value in report.values():
+        assert np.shape(value) == ALPHAS.shape
+    np.testing.assert_allclose(report["circulation_relative_error"], 0, atol=1e-4)
+
+    scalar = verify_circulation(0.02, 0.4, ALPHAS[2], CONVERGED)
+    assert all(np.ndim(value) == 0 for value in scalar.values())
+    assert scalar["circulation"] == report["circulation"][2]
+
+    poly = verify_circulation_poly([0.1, -0.05, 0.02, -0.01, 0.29], ALPHAS, CONVERGED)
+    np.testing.assert_allclose(poly["circulation_relative_error"], 0, atol=1e-4)
+
+
+def test_verify_zero_circulation():
+    report = verify_circulation(0.0, 0.4, [0.0, 0.05], CONVERGED)
+    assert np.isnan(report["circulation_relative_error"][0])
+    assert np.isfinite(report["circulation_relative_error"][1])
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from airfoilSolution import SolverConfig, converged_solution, get_solution
+
+NACA = (0.02, 0.4)
+ALPHA = 0.05
+
+
+def test_bound_circulation_follows_the_config():
+    default = get_solution(*NACA).bound_circulation(ALPHA)
+    assert default == get_solution(*NACA, config=SolverConfig(100)).bound_circulation(ALPHA)
+    assert default != get_solution(*NACA, config=SolverConfig(200)).bound_circulation(ALPHA)
+    assert default != get_solution(*NACA, config=SolverConfig(100, "cosine")).bound_circulation(ALPHA)
+
+
+@pytest.mark.parametrize("quantity", ["circulation", "Cl"])
+def test_default_study_converges_early(quantity):
+    result = converged_solution(*NACA, ALPHA, quantity)
+    assert result.converged
+    assert result.change <= 1e-4
+    assert result.solution.config.spacing == "cosine"
+    assert result.solution.config.n_panels == 200
+
+
+@pytest.mark.parametrize("quantity", ["circulation", "bound_circulation", "Cl"])
+def test_zero_quantity_converges(quantity):
+    # A symmetric section at zero incidence carries no circulation or lift
+    result = converged_solution(0.0, 0.4, 0.0, quantity)
+    assert result.converged
+    assert np.isfinite(result.change)
+    assert result.solution.config.n_panels == 200
+
+
+def test_reports_running_out_of_panels():
+    result = converged_solution(*NACA, ALPHA, "Cl", tol=1e-12, max_panels=400)
+    assert not result.converged
+    assert result.solution.config.n_panels == 400
+    assert result.change > 1e-12
+
+    result = converged_solution(*NACA, ALPHA, max_panels=150)
+    assert not result.converged
+    assert result.solution.config.n_panels == 100
+    assert np.isnan(result.change)
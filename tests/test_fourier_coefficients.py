@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from calculateCL import compute_fourier_coefficients
+
+ALPHA = 0.05
+N_MAX = 10
+
+# (M, P): ordinary sections, and the edge cases the closed form handles through
+# special branches (no front section, no back section, no camber)
+SECTIONS = [(0.02, 0.4), (0.06, 0.2), (0.04, 0.7), (0.02, 0.0), (0.02, 1.0), (0.0, 0.4), (0.0, 0.0)]
+
+
+@pytest.mark.parametrize("M, P", SECTIONS)
+def test_analytic_matches_trapezoid(M, P):
+    analytic = compute_fourier_coefficients(M, P, ALPHA, N_MAX, method="analytic")
+    trapezoid = compute_fourier_coefficients(M, P, ALPHA, N_MAX)
+    assert analytic.shape == (N_MAX + 1,)
+    np.testing.assert_allclose(analytic, trapezoid, rtol=0, atol=1e-6)
+
+
+@pytest.mark.parametrize("M, P", SECTIONS)
+def test_analytic_matches_split_gauss_legendre(M, P):
+    analytic = compute_fourier_coefficients(M, P, ALPHA, N_MAX, method="analytic")
+    split = compute_fourier_coefficients(M, P, ALPHA, N_MAX, quadrature=("gauss-legendre", 16), split=True)
+    np.testing.assert_allclose(analytic, split, rtol=0, atol=1e-8)
+
+
+def test_analytic_uncambered_section():
+    coefficients = compute_fourier_coefficients(0.0, 0.4, ALPHA, N_MAX, method="analytic")
+    assert coefficients[0] == ALPHA
+    assert not coefficients[1:].any()
@@ -0,0 +1,67 @@
+import threading
+
+import numpy as np
+import pytest
+
+from Circulation import compute_circulation
+from jobQueue import JobCancelled, JobQueue, checkpoint
+from vectorField import compute_velocity
+
+
+def test_jobs_collect_their_own_metrics():
+    queue = JobQueue()
+    try:
+        job_id = queue.submit(compute_circulation, 0.03, 0.5, 0.1)
+        assert queue.status(job_id)["state"] in ("queued", "running", "done")
+        queue.result(job_id, timeout=60)
+        metrics = queue.status(job_id)["metrics"]
+    finally:
+        queue.shutdown()
+    assert "integration" in metrics["stages"]
+    assert metrics["stages"]["integration"]["calls"] >= 1
+
+
+def _large_velocity(started):
+    started.set()
+    x, y = np.meshgrid(np.linspace(-1.5, 2.5, 2000), np.linspace(-1, 2, 2000))
+    return compute_velocity(0.02, 0.4, x, y, 0.05)
+
+
+def test_cancel_stops_a_running_velocity_job():
+    queue = JobQueue(workers=1)
+    started = threading.Event()
+    try:
+        job_id = queue.submit(_large_velocity, started)
+        assert started.wait(60)
+        assert queue.cancel(job_id)
+        with pytest.raises(JobCancelled):
+            queue.result(job_id, timeout=60)
+        status = queue.status(job_id)
+    finally:
+        queue.shutdown()
+    assert status["state"] == "cancelled"
+    assert status["progress"] < 1
+
+
+def _wait_for_cancel(started):
+    started.set()
+    while True:
+        checkpoint()
+        threading.Event().wait(0.01)
+
+
+def test_shutdown_cancels_queued_jobs():
+    queue = JobQueue(workers=1)
+    started = threading.Event()
+    running = queue.submit(_wait_for_cancel, started, key="running")
+    queued = queue.submit(_wait_for_cancel, threading.Event(), key="queued")
+    assert started.wait(60)
+    queue.shutdown(wait=False)
+    assert queue.status(queued)["state"] == "cancelled"
+    with pytest.raises(JobCancelled):
+        queue.result(queued)
+
+    # The running job stops at its next checkpoint
+    with pytest.raises(JobCancelled):
+        queue.result(running, timeout=60)
+    assert queue.status(running)["state"] == "cancelled"
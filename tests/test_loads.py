@@ -0,0 +1,36 @@
+import numpy as np
+
+from calculateCL import compute_Cl, compute_loads, compute_loads_poly, loads_from_coefficients
+
+ALPHAS = np.radians([-4.0, 0.0, 2.0, 6.0])
+
+
+def test_lift_matches_compute_Cl():
+    loads = compute_loads(0.02, 0.4, ALPHAS)
+    expected = [compute_Cl(0.02, 0.4, alpha) for alpha in ALPHAS]
+    np.testing.assert_allclose(loads["Cl"], expected, rtol=1e-12)
+
+
+def test_symmetric_section():
+    lifting = ALPHAS[ALPHAS != 0]
+    loads = compute_loads(0.0, 0.4, lifting)
+    np.testing.assert_allclose(loads["Cm_c4"], 0, atol=1e-12)
+    np.testing.assert_allclose(loads["x_cp"], 0.25, rtol=1e-12)
+    np.testing.assert_allclose(loads["Cl"], 2 * np.pi * lifting, rtol=1e-12)
+
+
+def test_cambered_section_against_hand_coefficients():
+    # Parabolic arc z = 4h x(1 - x): dz/dx = 4h cosθ, so A0 = alpha, A1 = 4h and A2 = 0.
+    # NACA sections with P = 0.5 are this arc with h = M.
+    h = 0.03
+    A0, A1, A2 = 0.0, 4 * h, 0.0
+    Cl = np.pi * (2 * (ALPHAS + A0) + A1)
+    Cm_le = -(np.pi / 2) * (ALPHAS + A0 + A1 - A2 / 2)
+    for loads in (compute_loads(h, 0.5, ALPHAS, method="analytic"),
+                  compute_loads_poly([-4 * h, 4 * h, 0.0], ALPHAS),
+                  loads_from_coefficients([A0, A1, A2], ALPHAS)):
+        np.testing.assert_allclose(loads["Cm_c4"], np.pi / 4 * (A2 - A1), rtol=1e-12)
+        np.testing.assert_allclose(loads["Cm_c4"], -np.pi * h, rtol=1e-12)
+        np.testing.assert_allclose(loads["Cl"], Cl, rtol=1e-12)
+        np.testing.assert_allclose(loads["Cm_le"], Cm_le, rtol=1e-12)
+        np.testing.assert_allclose(loads["x_cp"], -Cm_le / Cl, rtol=1e-12)
@@ -0,0 +1,37 @@
+from multiprocessing import Pool
+
+import numpy as np
+
+from resultStore import ResultStore, open_polar_store
+
+WRITERS = 4
+APPENDS = 50
+
+
+def _append_rows(args):
+    path, writer = args
+    store = open_polar_store(path)
+    for i in range(APPENDS):
+        store.append({"M": 0.02, "P": 0.4, "alpha": writer * APPENDS + i,
+                      "Cl": writer, "Cm_le": 0.0, "Cm_c4": 0.0, "x_cp": 0.0})
+
+
+def test_concurrent_appends_keep_every_row(tmp_path):
+    path = str(tmp_path / "polars")
+    with Pool(WRITERS) as pool:
+        pool.map(_append_rows, [(path, writer) for writer in range(WRITERS)])
+
+    store = ResultStore(path)
+    assert len(store) == WRITERS * APPENDS
+    np.testing.assert_array_equal(np.sort(store["alpha"]), np.arange(WRITERS * APPENDS))
+    np.testing.assert_array_equal(store["Cl"], store["alpha"] // APPENDS)
+
+
+def test_append_sees_rows_of_other_writers(tmp_path):
+    first, second = open_polar_store(tmp_path), open_polar_store(tmp_path)
+    row = {"M": 0.02, "P": 0.4, "Cl": 1.0, "Cm_le": 0.0, "Cm_c4": 0.0, "x_cp": 0.0}
+    first.append({**row, "alpha": 1.0})
+    second.append({**row, "alpha": 2.0})
+    first.refresh()
+    assert len(first) == len(second) == 2
+    assert first.find(0.02, 0.4, [1.0, 2.0]).tolist() == [0, 1]
@@ -0,0 +1,19 @@
+import numpy as np
+
+from streamlines import compute_streamlines, inflow_seeds
+
+NACA = (0.02, 0.4)
+ALPHA = 0.05
+
+
+def test_exact_velocity_is_the_default():
+    seeds = inflow_seeds(5)
+    default = compute_streamlines(*NACA, *seeds, ALPHA, max_steps=50)
+    exact = compute_streamlines(*NACA, *seeds, ALPHA, velocity="exact", max_steps=50)
+    for path, expected in zip(default, exact):
+        np.testing.assert_array_equal(path, expected)
+
+    # The interpolated grid is opt-in and follows the exact streamlines closely away from the sheet
+    x, y, n_points = compute_streamlines(*NACA, *seeds, ALPHA, velocity="bilinear", max_steps=50)
+    np.testing.assert_array_equal(n_points, exact[2])
+    np.testing.assert_allclose(y, exact[1], atol=1e-3)
@@ -0,0 +1,29 @@
+import numpy as np
+
+import velocityGrid
+from airfoilSolution import get_solution
+from velocityGrid import GridCache
+
+SHAPE = (41, 31)
+
+
+def test_cache_dir_set_after_import(tmp_path, monkeypatch):
+    monkeypatch.setattr(velocityGrid, "CACHE_DIR", tmp_path)
+    solution = get_solution(0.02, 0.4)
+    built = GridCache().get(solution, shape=SHAPE)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    cache = GridCache()
+    loaded = cache.get(solution, shape=SHAPE)
+    assert isinstance(loaded.per_alpha, np.memmap)
+    np.testing.assert_array_equal(loaded.field(0.1), built.field(0.1))
+    # Memory-mapped grids are not held in memory
+    assert cache.cache_info().currsize == 1
+    assert cache.cache_info().nbytes == 0
+
+
+def test_own_directory_overrides_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(velocityGrid, "CACHE_DIR", tmp_path / "module")
+    GridCache(directory=tmp_path / "own").get(get_solution(0.02, 0.4), shape=SHAPE)
+    assert (tmp_path / "own").is_dir()
+    assert not (tmp_path / "module").exists()
@@ -0,0 +1,36 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import biotSavart
+from vectorField import compute_velocity
+
+NACA = (0.02, 0.4)
+ALPHA = 0.05
+SIDE = 1000
+
+# Peak allocations allowed on top of the inputs, as a multiple of the two output arrays.
+# Untiled, the direct sum over a 1000x1000 grid peaks at several gigabytes.
+PEAK_OUTPUTS = 3
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("jit", [True, False], ids=["jit", "tiled"])
+def test_large_grid_peak_memory(dtype, jit, monkeypatch):
+    # With numba the fused kernel takes the whole grid, without it the numpy path sums tile by tile
+    monkeypatch.setattr(biotSavart, "JIT", jit)
+    x, y = np.meshgrid(np.linspace(-1.5, 2.5, SIDE), np.linspace(-1, 2, SIDE))
+    compute_velocity(*NACA, x[:2], y[:2], ALPHA, dtype=dtype)  # Solve and compile outside the trace
+
+    tracemalloc.start()
+    try:
+        vel_x, vel_y = compute_velocity(*NACA, x, y, ALPHA, dtype=dtype)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert vel_x.shape == vel_y.shape == (SIDE * SIDE,)
+    assert vel_x.dtype == dtype
+    assert np.isfinite(vel_x).all() and np.isfinite(vel_y).all()
+    assert peak < PEAK_OUTPUTS * (vel_x.nbytes + vel_y.nbytes)
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from vectorField import compute_velocity, iter_velocity
+
+NACA = (0.02, 0.4)
+ALPHA = 0.05
+
+
+def _grid():
+    return np.meshgrid(np.linspace(-1.5, 2.5, 30), np.linspace(-1, 2, 20))
+
+
+def test_analytic_coefficients_match_quadrature():
+    trapezoid = compute_velocity(*NACA, *_grid(), ALPHA)
+    analytic = compute_velocity(*NACA, *_grid(), ALPHA, method="analytic")
+    for component, expected in zip(analytic, trapezoid):
+        assert component.shape == expected.shape
+        np.testing.assert_allclose(component, expected, rtol=0, atol=1e-4)
+
+    *_, vel_x, vel_y = list(iter_velocity(*NACA, *_grid(), ALPHA, method="analytic"))[-1]
+    np.testing.assert_array_equal(vel_x, analytic[0])
+    np.testing.assert_array_equal(vel_y, analytic[1])
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        compute_velocity(*NACA, *_grid(), ALPHA, method="simpson")
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+import numpy as np
+
+from vectorFieldUDF import compute_velocity_poly
+
+COEFFS = [0.1, -0.05, 0.02, -0.01, 0.29]
+ALPHA = 0.05
+
+# Output of the original per-vortex loop (before vectorization) on the app's 30x20 grid,
+# for COEFFS at ALPHA, with its trapezoid fourier coefficients A1..A99
+LEGACY = np.load(Path(__file__).parent / "data" / "velocity_poly_legacy.npz")
+
+
+def _grid():
+    return np.meshgrid(np.linspace(-1.5, 2.5, 30), np.linspace(-1, 2, 20))
+
+
+def test_matches_legacy_loop():
+    vel_x, vel_y = compute_velocity_poly(COEFFS, *_grid(), ALPHA, method="trapezoid")
+    assert vel_x.shape == vel_y.shape == (20, 30)
+    np.testing.assert_allclose(vel_x, LEGACY["vel_x"], rtol=0, atol=1e-10)
+    np.testing.assert_allclose(vel_y, LEGACY["vel_y"], rtol=0, atol=1e-10)
+
+
+def test_exact_coefficients_stay_close_to_legacy():
+    # The default Chebyshev coefficients are exact, the legacy quadrature is off by up to about 0.1
+    vel_x, vel_y = compute_velocity_poly(COEFFS, *_grid(), ALPHA)
+    assert vel_x.shape == (20, 30)
+    assert np.abs(vel_x - LEGACY["vel_x"]).max() < 0.2
+    assert np.abs(vel_y - LEGACY["vel_y"]).max() < 0.2
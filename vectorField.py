@@ -1,8 +1,11 @@
-from calculateCL import *
-from numpy import *
-from matplotlib.pyplot import *
-from camberline import *
-
+import numpy as np
+from calculateCL import compute_fourier_coefficients, sum_sine_series
+from biotSavart import TREE_THETA
+from velocityGrid import interpolated_velocity
+from instrumentation import timed
+from airfoilSolution import DEFAULT_CONFIG, get_solution
+
+@timed("gamma")
 def sumAn(M,P,x,n): 
     """
     Calculate the of An upto given n
@@ -10,33 +13,28 @@ def sumAn(M,P,x,n):
     P -> Max camber
     x -> x coordinate
     """
-    Sum = 0
-    theta = arccos(1-2*x)
-    for i in range (1,n):
-        Sum += (compute_An(M,P,i) * sin(i*theta))
-    return Sum
+    theta = np.arccos(1-2*x)
+    return sum_sine_series(compute_fourier_coefficients(M,P,0,n-1), theta)
 
-def Calculate_gamma(M,P,x,alpha): 
+def Calculate_gamma(M,P,x,alpha,method="trapezoid",config=DEFAULT_CONFIG): 
     """
     Calculate the circulation distribution at a particular x coordinate of the airfoil
     M -> max camber (0,1)
     P -> positon of it (0,1)
     x -> x coordinate of the camber point around wihc we calculating circulation distribution
     alpha -> angle in radians
+    method -> "trapezoid" or "analytic" fourier coefficients
+    config -> SolverConfig (fourier order and free-stream velocity)
     """
-    u = 20 # Free Stream velocity as per our simulations
-    AnTotal = sumAn(M,P,x,100) 
-    A0 = compute_A0(M,P,alpha)
-    theta = arccos(1-2*x)
-    gamma = 2*u*((A0*(1+cos(theta))/sin(theta)) + AnTotal)
-    return gamma
+    return get_solution(M,P,method,config).gamma(x,alpha)
 
 
 
 
 
 
-def compute_velocity(M, P, x, y, alpha):
+def compute_velocity(M, P, x, y, alpha, chunk_size=None, dtype=np.float64, config=DEFAULT_CONFIG,
+                     kernel="direct", theta=TREE_THETA, interpolation=None, method="trapezoid"):
     """
     Computes the net velocity at given points (x, y) by summing induced velocity 
     vectors and free-stream velocity.
@@ -47,38 +45,34 @@ def compute_velocity(M, P, x, y, alpha):
     x : array-like -> X-coordinates of the points 
     y : array-like -> Y-coordinates of the points 
     alpha : float -> Angle of attack (in radians)
+    chunk_size : int -> Field points per tile, bounds the temporary memory
+    dtype : numpy dtype -> float64, or float32 for large grids
+    config : SolverConfig -> Vortex panels, fourier order and free-stream velocity
+    kernel : str -> "direct" summation or "tree" code for very large grids
+    theta : float -> Tree opening ratio, smaller is more accurate
+    interpolation : str -> None sums Biot-Savart exactly, "bilinear" or "bicubic" interpolate the
+                           velocity grid cached per geometry (any alpha is a linear combination of
+                           two basis fields, see velocityGrid), points outside the grid stay exact
+    method : str -> "trapezoid" (quadrature) or "analytic" (closed form) fourier coefficients
 
     Returns:
     vel_x, vel_y : array-like -> Components of the velocity vector at (x, y)
     """
-    # Ensure x and y are flattened to 1D arrays
-    x = np.asarray(x).flatten()  # Shape: (n_points,)
-    y = np.asarray(y).flatten()  # Shape: (n_points,)
-
-    u = 20  # Free-stream velocity
-
-    # Generate vortex element positions along the camber line
-    vortex_points = np.linspace(0.005, 0.995, 100)  # Shape: (100,)
-    yi = camber_line(vortex_points, M, P)  # Camber line heights (Shape: (100,))
+    solution = get_solution(M, P, method, config)
+    if interpolation is not None:
+        return interpolated_velocity(solution, x, y, alpha, interpolation)
 
-    # Broadcast vortex points and circle points to compute distances
-    dx = x[:, None] - vortex_points  # Shape: (len(x), 100)
-    dy = y[:, None] - yi             # Shape: (len(y), 100)
-    r = np.sqrt(dx**2 + dy**2)       # Distances (Shape: (len(x), 100))
+    # Vortex strengths are cached per geometry, only the induced velocity sum is recomputed
+    return solution.velocity(x, y, alpha, chunk_size, dtype, kernel, theta)  # Return velocity components
 
-    # Compute induced velocity strength for all vortex points and circle points
-    gamma = Calculate_gamma(M, P, vortex_points, alpha)  # Circulation strengths (Shape: (100,))
-    v_ind = gamma[None, :] * 0.01 / (2 * np.pi * r)      # Induced velocity magnitudes (Shape: (len(x), 100))
 
-    # Compute induced velocity components
-    sint = dy / r  # Sine of angle (Shape: (len(x), 100))
-    cost = dx / r  # Cosine of angle (Shape: (len(x), 100))
-    vel_x_ind = np.sum(v_ind * sint, axis=1)  # Total induced x-velocity (Shape: (len(x),))
-    vel_y_ind = np.sum(-v_ind * cost, axis=1) # Total induced y-velocity (Shape: (len(x),))
-
-    # Add free-stream velocity components
-    vel_x = vel_x_ind + u * np.cos(alpha)
-    vel_y = vel_y_ind + u * np.sin(alpha)
-    return vel_x, vel_y  # Return velocity components
+def iter_velocity(M, P, x, y, alpha, chunk_size=None, dtype=np.float64, config=DEFAULT_CONFIG,
+                  kernel="direct", theta=TREE_THETA, method="trapezoid"):
+    """
+    Streams compute_velocity over tiles of field points, for progressive drawing of
+    high-resolution grids.
 
-     
\ No newline at end of file
+    Yields:
+    start, stop, vel_x, vel_y -> Tile range and the flattened velocity arrays, filled up to stop
+    """
+    return get_solution(M, P, method, config).iter_velocity(x, y, alpha, chunk_size, dtype, kernel, theta)
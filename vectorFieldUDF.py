@@ -1,63 +1,65 @@
 
-from calculateCL import *
-from numpy import *
-from matplotlib.pyplot import *
-from camberline import *
-
+import numpy as np
+from calculateCL import compute_fourier_coefficients_poly, poly_fourier_order, sum_sine_series
+from biotSavart import TREE_THETA
+from velocityGrid import interpolated_velocity
+from instrumentation import timed
+from airfoilSolution import DEFAULT_CONFIG, get_solution_poly
+
+@timed("gamma")
 def sumAn(coeffs,x,n): # A function that peforms summation of small gamma
-    Sum = 0
-    theta = arccos(1-2*x)
-    for i in range (1,n):
-        Sum += (compute_An_poly(coeffs,i) * sin(i*theta))
-    return Sum
+    theta = np.arccos(1-2*x)
+    n_max = min(n-1, poly_fourier_order(coeffs)) # A_n is exactly zero beyond the slope degree
+    return sum_sine_series(compute_fourier_coefficients_poly(coeffs,0,n_max), theta)
 
-def Calculate_gamma(coeffs,x,alpha): # Function used to calculate big gamma
-    u = 20
-     # Free Stream velocity as per our simulations
-    AnTotal = sumAn(coeffs,x,100)
-    A0 = compute_A0_poly(coeffs,alpha)
-    theta = arccos(1-2*x)
-    gamma = 2*u*((A0*(1+cos(theta))/sin(theta)) + AnTotal)
-    return gamma
+def Calculate_gamma(coeffs,x,alpha,config=DEFAULT_CONFIG): # Function used to calculate big gamma
+    return get_solution_poly(coeffs,config).gamma(x,alpha)
 
 
 
-def compute_velocity_poly(coeffs, x, y, alpha):
+def compute_velocity_poly(coeffs, x, y, alpha, chunk_size=None, dtype=np.float64, config=DEFAULT_CONFIG,
+                          kernel="direct", theta=TREE_THETA, interpolation=None, method="chebyshev"):
     """ 
-    Computes the net velocity at a given point (x, y) by summing induced velocity 
+    Computes the net velocity at given points (x, y) by summing induced velocity 
     vectors and free-stream velocity.
 
     Parameters:
-
-    x : float -> X-coordinate of the point
-    y : float -> Y-coordinate of the point
+    coeffs : list -> Coefficients of the polynomial [a_n, ..., a_1, a_0] (highest order first)
+    x : array-like -> X-coordinates of the points
+    y : array-like -> Y-coordinates of the points
     alpha : float -> Angle of attack (in radians)
+    chunk_size : int -> Field points per tile, bounds the temporary memory
+    dtype : numpy dtype -> float64, or float32 for large grids
+    config : SolverConfig -> Vortex panels, fourier order and free-stream velocity
+    kernel : str -> "direct" summation or "tree" code for very large grids
+    theta : float -> Tree opening ratio, smaller is more accurate
+    interpolation : str -> None sums Biot-Savart exactly, "bilinear" or "bicubic" interpolate the
+                           velocity grid cached per geometry (any alpha is a linear combination of
+                           two basis fields, see velocityGrid), points outside the grid stay exact
+    method : str -> "chebyshev" (exact) or "trapezoid" (the original quadrature) fourier coefficients
 
     Returns:
-    vel_x, vel_y : list -> Components of the velocity vector at (x, y)
+    vel_x, vel_y : list -> Components of the velocity vector at (x, y), same shape as x
     """
-    u = 20
-      # Free-stream velocity
-    vel_x, vel_y = 0,0# Initialize velocity components
-
-    # Iterate over vortex elements along the camber line, ignoring points near edges
-    for i in np.linspace(0.005, 0.995, 100):
-        yi = np.polyval(coeffs, i)   # Get camber line height at i
-        r = np.sqrt((x - i)**2 + (y - yi)**2)  # Distance from vortex element
+    shape = np.shape(x)
 
-        # Compute induced velocity using circulation strength
-        v_ind = Calculate_gamma(coeffs,i, alpha) * 0.01 / (2 * np.pi * r)
+    solution = get_solution_poly(coeffs, config, method)
+    if interpolation is not None:
+        vel_x, vel_y = interpolated_velocity(solution, x, y, alpha, interpolation)
+    else:
+        # Vortex strengths are cached per geometry, only the induced velocity sum is recomputed
+        vel_x, vel_y = solution.velocity(x, y, alpha, chunk_size, dtype, kernel, theta)
 
-        # Compute velocity components due to induced flow
-        cost = (x - i) / r
-        sint = (y - yi) / r
-        vel_x += v_ind * sint
-        vel_y -= v_ind * cost
+    return [vel_x.reshape(shape), vel_y.reshape(shape)]  # Return velocity components
 
-    # Add free-stream velocity components
-    vel_x += u * np.cos(alpha)
-    vel_y += u * np.sin(alpha)
-
-    return [vel_x, vel_y]  # Return velocity components
 
+def iter_velocity_poly(coeffs, x, y, alpha, chunk_size=None, dtype=np.float64, config=DEFAULT_CONFIG,
+                       kernel="direct", theta=TREE_THETA, method="chebyshev"):
+    """
+    Streams compute_velocity_poly over tiles of field points, for progressive drawing
+    of high-resolution grids.
 
+    Yields:
+    start, stop, vel_x, vel_y -> Tile range and the flattened velocity arrays, filled up to stop
+    """
+    return get_solution_poly(coeffs, config, method).iter_velocity(x, y, alpha, chunk_size, dtype, kernel, theta)
@@ -0,0 +1,281 @@
+import hashlib
+import threading
+import numpy as np
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+from instrumentation import stage, watch_cache
+
+FIELD_BOUNDS = (-1.5, 2.5, -1.0, 2.0)  # (x_min, x_max, y_min, y_max), the app's vector field window
+GRID_SHAPE = (301, 226)  # (nx, ny) samples over FIELD_BOUNDS, about one vortex panel apart
+INTERPOLATIONS = ("bilinear", "bicubic")
+CACHE_BYTES = 256 * 2**20  # Basis fields kept in memory, about 100 grids of GRID_SHAPE
+CACHE_DIR = None  # Directory of stored grids (.npy) for caches without their own, None keeps them in memory only
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "currsize", "nbytes"])
+
+
+class VelocityGrid:
+    """
+    Induced velocity of one vortex sheet sampled on a regular grid, stored as two basis
+    fields. gamma is linear in alpha, so the velocity at any alpha is
+
+        alpha * per_alpha + camber + u_inf * (cos(alpha), sin(alpha))
+
+    and changing alpha costs one linear combination of the grids, never a Biot-Savart sum.
+    Fields are stored as complex arrays vel_x + i vel_y of shape (nx, ny).
+    """
+
+    def __init__(self, x_axis, y_axis, per_alpha, camber, u_inf):
+        """
+        x_axis, y_axis : numpy array -> Evenly spaced grid coordinates
+        per_alpha, camber : numpy array -> Complex induced velocity basis fields, shape (nx, ny)
+        u_inf : float -> Free-stream velocity
+        """
+        self.x_axis = np.asarray(x_axis, dtype=float)
+        self.y_axis = np.asarray(y_axis, dtype=float)
+        self.per_alpha = per_alpha
+        self.camber = camber
+        self.u_inf = float(u_inf)
+
+    @classmethod
+    def from_solution(cls, solution, bounds=FIELD_BOUNDS, shape=GRID_SHAPE):
+        """
+        Samples both basis fields of an AirfoilSolution over bounds
+        """
+        x_axis = np.linspace(bounds[0], bounds[1], shape[0])
+        y_axis = np.linspace(bounds[2], bounds[3], shape[1])
+        x, y = np.meshgrid(x_axis, y_axis, indexing="ij")
+        per_alpha, camber = ((vel_x + 1j * vel_y).reshape(shape) for vel_x, vel_y in solution.velocity_basis(x, y))
+        return cls(x_axis, y_axis, per_alpha, camber, solution.config.u_inf)
+
+    @property
+    def bounds(self):
+        return (self.x_axis[0], self.x_axis[-1], self.y_axis[0], self.y_axis[-1])
+
+    @property
+    def nbytes(self):
+        return self.per_alpha.nbytes + self.camber.nbytes
+
+    def field(self, alpha):
+        """
+        Net velocity (induced + free stream) on the grid at angle of attack alpha (radians), as vel_x + i vel_y
+        """
+        return alpha * self.per_alpha + self.camber + self.u_inf * np.exp(1j * alpha)
+
+    def at(self, alpha, interpolation="bilinear"):
+        """
+        Callable (x, y) -> (vel_x, vel_y) interpolating the net velocity at alpha. The field
+        is combined once, so repeated queries (e.g. streamline steps) only interpolate.
+        """
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Unknown interpolation: {interpolation}, choose from {INTERPOLATIONS}")
+        interpolate = bilinear if interpolation == "bilinear" else bicubic
+        field = self.field(alpha)
+
+        def velocity(x, y):
+            with stage("interpolation"):
+                velocity = interpolate(self.x_axis, self.y_axis, field, np.asarray(x, dtype=float),
+                                       np.asarray(y, dtype=float))
+            return velocity.real, velocity.imag
+        return velocity
+
+    def velocity(self, x, y, alpha, interpolation="bilinear"):
+        """
+        Net velocity at points (x, y), same shape as x. Points outside the grid are extrapolated.
+        """
+        return self.at(alpha, interpolation)(x, y)
+
+    def contains(self, x, y):
+        """
+        Mask of the points inside the grid
+        """
+        x_min, x_max, y_min, y_max = self.bounds
+        return (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+
+    def save(self, path):
+        """
+        Writes the grid to the directory path as per_alpha.npy, camber.npy and meta.npy
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / "per_alpha.npy", self.per_alpha)
+        np.save(path / "camber.npy", self.camber)
+        np.save(path / "meta.npy", np.array([*self.bounds, self.u_inf]))
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """
+        Reads a grid written by save, memory-mapped by default (see numpy.load)
+        """
+        path = Path(path)
+        per_alpha = np.load(path / "per_alpha.npy", mmap_mode=mmap_mode)
+        camber = np.load(path / "camber.npy", mmap_mode=mmap_mode)
+        x_min, x_max, y_min, y_max, u_inf = np.load(path / "meta.npy")
+        nx, ny = per_alpha.shape
+        return cls(np.linspace(x_min, x_max, nx), np.linspace(y_min, y_max, ny), per_alpha, camber, u_inf)
+
+
+class GridCache:
+    """
+    Least recently used VelocityGrids, bounded by the bytes of their basis fields and
+    shared by all threads. With a directory, missing grids are loaded from (and new
+    ones written to) .npy files, so they survive restarts and can be shared by processes.
+    Loaded grids are memory-mapped and left to the page cache, so they do not count
+    towards max_bytes.
+    """
+
+    def __init__(self, max_bytes=CACHE_BYTES, directory=None):
+        """
+        max_bytes : int -> Bytes of in-memory basis fields kept
+        directory : str -> Directory of stored grids, None follows the module's CACHE_DIR
+                           (read on every miss, so it can be set after import)
+        """
+        self.max_bytes = max_bytes
+        self._directory = directory
+        self._grids = OrderedDict()
+        self._nbytes = 0
+        self._hits = self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, solution, bounds=FIELD_BOUNDS, shape=GRID_SHAPE):
+        """
+        The VelocityGrid of an AirfoilSolution over bounds, built on the first request
+        """
+        bounds, shape = tuple(map(float, bounds)), tuple(map(int, shape))
+        key = (solution.fingerprint, bounds, shape)
+        with self._lock:
+            grid = self._grids.get(key)
+            if grid is not None:
+                self._grids.move_to_end(key)
+                self._hits += 1
+                return grid
+            self._misses += 1
+
+        grid = self._load(key)
+        if grid is None:
+            grid = VelocityGrid.from_solution(solution, bounds, shape)
+            self._store(key, grid)
+        with self._lock:
+            if key not in self._grids and _resident_bytes(grid) <= self.max_bytes:
+                self._grids[key] = grid
+                self._nbytes += _resident_bytes(grid)
+                while self._nbytes > self.max_bytes:
+                    self._nbytes -= _resident_bytes(self._grids.popitem(last=False)[1])
+        return grid
+
+    @property
+    def directory(self):
+        return self._directory if self._directory is not None else CACHE_DIR
+
+    def _load(self, key):
+        directory = self.directory
+        if directory is None:
+            return None
+        path = Path(directory) / hashlib.sha1(repr(key).encode()).hexdigest()
+        if (path / "meta.npy").exists():
+            return VelocityGrid.load(path)
+        return None
+
+    def _store(self, key, grid):
+        directory = self.directory
+        if directory is not None:
+            grid.save(Path(directory) / hashlib.sha1(repr(key).encode()).hexdigest())
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, len(self._grids), self._nbytes)
+
+    def cache_clear(self):
+        with self._lock:
+            self._grids.clear()
+            self._nbytes = 0
+            self._hits = self._misses = 0
+
+
+def _resident_bytes(grid):
+    """
+    Bytes of a grid held in memory, memory-mapped fields are backed by their files
+    """
+    return sum(0 if isinstance(field, np.memmap) else field.nbytes for field in (grid.per_alpha, grid.camber))
+
+
+GRID_CACHE = watch_cache("velocity_grids")(GridCache())
+
+
+def velocity_grid(solution, bounds=FIELD_BOUNDS, shape=GRID_SHAPE):
+    """
+    Cached VelocityGrid of an AirfoilSolution, see GridCache
+    """
+    return GRID_CACHE.get(solution, bounds, shape)
+
+
+def interpolated_velocity(solution, x, y, alpha, interpolation="bilinear", bounds=FIELD_BOUNDS, shape=GRID_SHAPE):
+    """
+    Net velocity at points (x, y) interpolated from the cached grid of solution, flattened
+    to (n_points,) like AirfoilSolution.velocity. Points outside the grid are computed exactly.
+    """
+    grid = velocity_grid(solution, bounds, shape)
+    x, y = np.ravel(x).astype(float), np.ravel(y).astype(float)
+    inside = grid.contains(x, y)
+    vel_x, vel_y = grid.at(alpha, interpolation)(x, y)
+    if not inside.all():
+        vel_x[~inside], vel_y[~inside] = solution.velocity(x[~inside], y[~inside], alpha)
+    return vel_x, vel_y
+
+
+def bilinear(x_axis, y_axis, values, x, y):
+    """
+    Bilinear interpolation on a regular grid, points outside it extrapolate from the edge cells.
+
+    Parameters:
+    x_axis, y_axis : numpy array -> Evenly spaced grid coordinates
+    values : numpy array -> Samples of shape (..., len(x_axis), len(y_axis))
+    x, y : numpy array -> Query points
+
+    Returns:
+    result : numpy array -> Interpolated values of shape values.shape[:-2] + x.shape
+    """
+    i, s = _cell(x_axis, x)
+    j, t = _cell(y_axis, y)
+    flat = values.reshape(values.shape[:-2] + (-1,))
+    corner = i * len(y_axis) + j  # Flat index of the lower-left corner
+    lower = np.take(flat, corner, axis=-1) * (1 - t) + np.take(flat, corner + 1, axis=-1) * t
+    corner += len(y_axis)
+    upper = np.take(flat, corner, axis=-1) * (1 - t) + np.take(flat, corner + 1, axis=-1) * t
+    return lower + (upper - lower) * s
+
+
+def bicubic(x_axis, y_axis, values, x, y):
+    """
+    Bicubic (Catmull-Rom) interpolation on a regular grid, same arguments as bilinear.
+    Exact for quadratics and continuous in slope, at 16 samples per point instead of 4.
+    Grids need at least 2 points per axis, neighbours past the edges repeat the edge samples.
+    """
+    i, s = _cell(x_axis, x)
+    j, t = _cell(y_axis, y)
+    flat = values.reshape(values.shape[:-2] + (-1,))
+    nx, ny = len(x_axis), len(y_axis)
+    columns = [np.clip(j + offset, 0, ny - 1) for offset in (-1, 0, 1, 2)]
+    result = 0
+    for x_weight, offset in zip(_catmull_rom(s), (-1, 0, 1, 2)):
+        row = np.clip(i + offset, 0, nx - 1) * ny
+        result = result + x_weight * sum(weight * np.take(flat, row + column, axis=-1)
+                                         for weight, column in zip(_catmull_rom(t), columns))
+    return result
+
+
+def _catmull_rom(t):
+    """
+    Weights of the samples at offsets -1, 0, 1 and 2 for a fractional position t
+    """
+    t2, t3 = t * t, t * t * t
+    return ((-t3 + 2 * t2 - t) / 2, (3 * t3 - 5 * t2 + 2) / 2, (-3 * t3 + 4 * t2 + t) / 2, (t3 - t2) / 2)
+
+
+def _cell(axis, x):
+    """
+    Index of the cell holding x and the fractional position of x in it
+    """
+    position = (x - axis[0]) * ((len(axis) - 1) / (axis[-1] - axis[0]))
+    index = np.minimum(np.maximum(position.astype(np.intp), 0), len(axis) - 2)  # Truncation is floor inside the grid
+    return index, position - index